@@ -1,7 +1,7 @@
 import os
 import re
 import xml.etree.ElementTree as ET
-from typing import Type, TypeVar, Optional, Dict
+from typing import Type, TypeVar, Optional, Dict, List
 
 import httpx
 import openai
@@ -13,7 +13,7 @@ from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
 load_dotenv()
 
@@ -35,7 +35,7 @@ OPENROUTER_HTTP_REFERER = os.getenv("OPENROUTER_HTTP_REFERER", "https://www.thef
 # Define a generic type for the output model
 T = TypeVar('T')
 
-logger = get_logger()
+logger = LazyLogger()
 
 
 class FileComponentCategory(BaseModel):
@@ -219,14 +219,16 @@ def xml_from_string(param: str) -> ET.XML:
     return xml
 
 
-def categorize_files_openrouter_xml(file_paths: list[str], model: str = "google/gemini-2.5-flash-preview") \
-        -> Dict[str, str]:
+def categorize_files_openrouter_xml(file_paths: list[str], model: str = "google/gemini-2.5-flash-preview",
+                                    components: Optional[List[str]] = None) -> Dict[str, str]:
     """
     Use OpenRouter directly to categorize file paths into components, returning XML and parsing it.
 
     Args:
         file_paths: List of file paths to categorize.
         model: The model to use (default: gemini-2.5-flash-preview).
+        components: Component names to choose from, so that files categorized in separate
+            calls share one naming scheme. If None, the model picks its own names.
 
     Returns:
         A mapping of file path to component name.
@@ -243,10 +245,17 @@ def categorize_files_openrouter_xml(file_paths: list[str], model: str = "google/
 
     file_list_str = "\n".join(f"- {p}" for p in file_paths)
     xml_example = '''<files>\n  <file path="src/api/foo.py">API Services</file>\n  <file path="src/core/bar.py">Core Functionality</file>\n  <file path="src/utils/baz.py">Utilities</file>\n</files>'''
+    if components:
+        component_instruction = (
+            "Please categorize each file path into exactly one of these components, using the name "
+            f"exactly as written: {', '.join(components)}.\n"
+        )
+    else:
+        component_instruction = "Please categorize each file path into a high-level component (User Interface, API Services, Core Functionality, Utilities, Data Models, Business Services, Persistence Layer, etc.).\n"
     prompt = (
         f"You are an expert software architect.\n"
         f"Here is a list of file paths:\n{file_list_str}\n"
-        "Please categorize each file path into a high-level component (User Interface, API Services, Core Functionality, Utilities, Data Models, Business Services, Persistence Layer, etc.).\n"
+        f"{component_instruction}"
         "Return the result as XML in the following format:\n"
         f"{xml_example}\n"
         "Only return the <files> XML, nothing else."
@@ -25,10 +25,10 @@ import schema_cat
 from pydantic import BaseModel, Field
 
 from code_processor import CodeProcessor
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
 # Set up logging
-logger = get_logger("tfc-code-pipeline.bug_analyzer")
+logger = LazyLogger("tfc-code-pipeline.bug_analyzer")
 
 
 def force_debug_logging(logger):
@@ -11,15 +11,16 @@ import subprocess
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Union
 
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
 
-from find_source_files import find_source_files as find_files
+from find_source_files import find_source_files as find_files, iter_source_files
 
 
 class CodeProcessor(ABC):
@@ -133,12 +134,12 @@ class CodeProcessor(ABC):
 
     # --- Core Processing Logic ---
 
-    def _group_files_by_parent_directory(self, files: List[str], min_files_per_chunk: int = 10,
+    def _group_files_by_parent_directory(self, files: Iterable[str], min_files_per_chunk: int = 10,
                                          max_files_per_chunk: int = 20) -> List[List[str]]:
         """Group files by parent directory and ensure each chunk has between min_files_per_chunk and max_files_per_chunk files.
 
         Args:
-            files: List of file paths to group.
+            files: File paths to group; iterated only once.
             min_files_per_chunk: Minimum number of files per chunk (when possible).
             max_files_per_chunk: Maximum number of files per chunk.
 
@@ -230,11 +231,11 @@ class CodeProcessor(ABC):
 
         return chunks
 
-    def _display_file_chunks(self, source_files: List[str]) -> None:
+    def _display_file_chunks(self, source_files: Iterable[str]) -> None:
         """Display information about the file chunks without processing them.
 
         Args:
-            source_files: List of source files to group into chunks.
+            source_files: Source files to group into chunks; iterated only once.
         """
         # Group files by parent directory
         min_files_per_chunk = 5
@@ -419,21 +420,24 @@ class CodeProcessor(ABC):
             if args.show_only_repo_files_chunks:
                 # Find source files
                 if args.file:
-                    source_files = [args.file]
+                    source_files = iter([args.file])
                     logger.warning(f"Using specific file: {args.file}")
                 else:
-                    # Validate directory before calling find_files
+                    # Validate directory before walking it
                     if not args.directory or not Path(args.directory).is_dir():
                         logger.error(f"Invalid directory: {args.directory}")
                         return 1
-                    source_files = find_files(args.directory)
+                    source_files = iter_source_files(args.directory)
 
-                if not source_files:
+                # Peek at the first file to detect an empty tree without
+                # collecting the whole walk into a list first
+                first_file = next(source_files, None)
+                if first_file is None:
                     logger.error(f"No source files found in directory: {args.directory}")
                     return 1
 
                 # Display the file chunks without processing
-                self._display_file_chunks(source_files)
+                self._display_file_chunks(chain((first_file,), source_files))
                 return 0
 
             # Normal processing mode
@@ -14,10 +14,10 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from ai import create_agent
-from logging_utils import get_logger
+from logging_utils import LazyLogger, get_logger
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
 
 
 # Pydantic models for the master complexity report
@@ -113,7 +113,7 @@ class ComplexityAnalyzerProcessor(CodeProcessor):
                 return super().run()  # Delegate to base class run for this flag
 
             # Check if we should skip individual report generation
-            if hasattr(args, 'skip') and args.skip:
+            if getattr(args, 'skip', False):
                 logger.info("Skipping individual report generation as --skip flag is used.")
                 processed_files = []  # No files processed as we're skipping
             else:
@@ -134,7 +134,7 @@ class ComplexityAnalyzerProcessor(CodeProcessor):
             if report_files:
                 logger.info(f"Found {len(report_files)} complexity reports to combine.")
                 # Determine output path for the master report
-                output_path = args.output if hasattr(args, 'output') and args.output else None
+                output_path = getattr(args, 'output', None) or None
                 master_report_path = self._combine_complexity_reports(report_files, args.directory, output_path)
                 if master_report_path and os.path.exists(master_report_path):
                     logger.info(f"Master complexity report created successfully: {master_report_path}")
@@ -358,7 +358,7 @@ class ComplexityAnalyzerProcessor(CodeProcessor):
         """
         directory = args.directory
         specific_file = args.file
-        skip = args.skip if hasattr(args, 'skip') else False
+        skip = getattr(args, 'skip', False)
 
         # --- Skip Logic --- Find existing reports if skip is enabled
         existing_reports = []
@@ -14,10 +14,10 @@ import subprocess
 import sys
 from typing import Dict, List, Optional, Any
 
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
 
 # Import relative to the 'src' package
 from code_processor import CodeProcessor
@@ -27,7 +27,20 @@ from bug_analyzer import BugAnalyzerProcessor
 
 DEFAULT_ENV_FILE = ".env"
 
-init(autoreset=True)
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that renders every color as an empty string."""
+
+    def __getattr__(self, _name: str) -> str:
+        return ""
+
+
+# Only pay for colorama's stream wrapping when a terminal will render the colors;
+# piped output (CI logs, redirects) gets plain text instead.
+if sys.stdout.isatty():
+    init(autoreset=True)
+else:
+    Fore = Style = _NoColor()
 
 SPINNER_CHARS = ["|", "/", "-", "\\"]
 
@@ -135,6 +148,22 @@ def parse_and_report_bugs(xml_path: str, severity_threshold: str, confidence_thr
     severity_threshold_value = SEVERITY_LEVELS.get(severity_threshold.lower(), 0)
     confidence_threshold_value = CONFIDENCE_LEVELS.get(confidence_threshold.lower(), 0)
 
+    # Build the colored fragments once rather than per bug
+    prefix_exceeded = f"{Fore.RED}[THRESHOLD EXCEEDED]"
+    prefix_info = f"{Fore.YELLOW}[INFO]"
+    severity_displays = {
+        "high": f"{Fore.RED}HIGH{Style.RESET_ALL}",
+        "medium": f"{Fore.YELLOW}MEDIUM{Style.RESET_ALL}",
+        "low": f"{Fore.CYAN}LOW{Style.RESET_ALL}",
+    }
+    confidence_displays = {
+        "high": f"{Fore.GREEN}HIGH{Style.RESET_ALL}",
+        "medium": f"{Fore.YELLOW}MEDIUM{Style.RESET_ALL}",
+        "low": f"{Fore.RED}LOW{Style.RESET_ALL}",
+    }
+    unknown_color = Fore.WHITE
+    reset = Style.RESET_ALL
+
     # Track if any issues exceed thresholds
     threshold_exceeded = False
 
@@ -154,33 +183,19 @@ def parse_and_report_bugs(xml_path: str, severity_threshold: str, confidence_thr
 
         if exceeds_threshold:
             threshold_exceeded = True
-            prefix = f"{Fore.RED}[THRESHOLD EXCEEDED]"
-        else:
-            prefix = f"{Fore.YELLOW}[INFO]"
-
-        # Format severity and confidence with colors
-        if severity in SEVERITY_LEVELS:
-            if severity == "high":
-                severity_display = f"{Fore.RED}{severity.upper()}"
-            elif severity == "medium":
-                severity_display = f"{Fore.YELLOW}{severity.upper()}"
-            else:
-                severity_display = f"{Fore.CYAN}{severity.upper()}"
+            prefix = prefix_exceeded
         else:
-            severity_display = f"{Fore.WHITE}{severity}"
-
-        if confidence in CONFIDENCE_LEVELS:
-            if confidence == "high":
-                confidence_display = f"{Fore.GREEN}{confidence.upper()}"
-            elif confidence == "medium":
-                confidence_display = f"{Fore.YELLOW}{confidence.upper()}"
-            else:
-                confidence_display = f"{Fore.RED}{confidence.upper()}"
-        else:
-            confidence_display = f"{Fore.WHITE}{confidence}"
+            prefix = prefix_info
+
+        severity_display = severity_displays.get(severity)
+        if severity_display is None:
+            severity_display = f"{unknown_color}{severity}{reset}"
+        confidence_display = confidence_displays.get(confidence)
+        if confidence_display is None:
+            confidence_display = f"{unknown_color}{confidence}{reset}"
 
         # Print the bug on a single line
-        print(f"{prefix} {file_path}:{line_number} - {description} [Severity: {severity_display}{Style.RESET_ALL}, Confidence: {confidence_display}{Style.RESET_ALL}]")
+        print(f"{prefix} {file_path}:{line_number} - {description} [Severity: {severity_display}, Confidence: {confidence_display}]")
 
     # Return non-zero exit code if any issues exceed thresholds
     if threshold_exceeded:
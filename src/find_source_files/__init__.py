@@ -8,14 +8,157 @@ excluding dependencies, tests, and other non-core files.
 
 import argparse
 import os
+import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, Iterator, List, Tuple, Union
 
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
+
+# Common source file extensions for various programming languages
+SOURCE_EXTENSIONS: FrozenSet[str] = frozenset({
+    # Python
+    '.py', '.pyx', '.pyi',
+    # JavaScript/TypeScript
+    '.js', '.jsx', '.ts', '.tsx',
+    # Java
+    '.java',
+    # C/C++
+    '.c', '.cpp', '.cc', '.cxx', '.h', '.hpp', '.hxx',
+    # C#
+    '.cs',
+    # Go
+    '.go',
+    # Ruby
+    '.rb',
+    # PHP
+    '.php',
+    # Swift
+    '.swift',
+    # Kotlin
+    '.kt', '.kts',
+    # Rust
+    '.rs',
+    # Scala
+    '.scala',
+    # Shell
+    '.sh', '.bash',
+    # HTML/CSS (sometimes considered source)
+    '.html', '.htm', '.css',
+    # Other
+    '.r', '.pl', '.pm', '.lua', '.groovy', '.dart', '.elm'
+})
+
+# Same extensions as a tuple, so a lowercased name can be matched with a single endswith
+SOURCE_SUFFIXES: Tuple[str, ...] = tuple(sorted(SOURCE_EXTENSIONS))
+
+# Common configuration file names and patterns
+CONFIG_FILE_NAMES: FrozenSet[str] = frozenset({
+    # General config files
+    'config.js', 'config.ts', 'config.json', 'config.yaml', 'config.yml',
+    'config.toml', 'config.ini', 'config.xml', 'config.env',
+    # Package managers
+    'package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml',
+    'composer.json', 'composer.lock', 'Gemfile', 'Gemfile.lock',
+    'requirements.txt', 'pyproject.toml', 'poetry.lock', 'Pipfile', 'Pipfile.lock',
+    # Build tools
+    'webpack.config.js', 'rollup.config.js', 'vite.config.js', 'babel.config.js',
+    'tsconfig.json', 'tslint.json', 'eslintrc.js', '.eslintrc.js', '.eslintrc.json',
+    'jest.config.js', 'vitest.config.js', 'karma.conf.js',
+    # CI/CD
+    '.travis.yml', '.gitlab-ci.yml', '.github/workflows/main.yml',
+    'Jenkinsfile', 'azure-pipelines.yml', 'bitbucket-pipelines.yml',
+    # Docker
+    'Dockerfile', 'docker-compose.yml', 'docker-compose.yaml',
+    # Other
+    '.env', '.env.example', '.env.local', '.env.development', '.env.production',
+    '.gitignore', '.gitattributes', '.editorconfig', '.prettierrc', '.prettierrc.js',
+    'README.md', 'LICENSE', 'CHANGELOG.md', 'CONTRIBUTING.md'
+})
+
+# Substrings that mark a file name as a config file
+CONFIG_FILE_PATTERNS: Tuple[str, ...] = (
+    # Config files with .config. in the name
+    '.config.',
+    # Files starting with dot
+    '.eslintrc', '.babelrc', '.stylelintrc',
+    # Common config file suffixes
+    'rc.js', 'rc.json', 'rc.yaml', 'rc.yml',
+    # Test config files
+    'test.config.', 'jest.config.', 'vitest.config.', 'karma.config.',
+    # Build config files
+    'webpack.', 'rollup.', 'vite.', 'babel.', 'postcss.config.'
+)
+
+# Common test file patterns
+TEST_FILE_PATTERNS: Tuple[str, ...] = (
+    'test_', 'tests_', '_test', '_tests',
+    'spec_', 'specs_', '_spec', '_specs',
+    '.test.', '.spec.', '-test.', '-spec.'
+)
+
+# Directory names that mark every file below them as a test file
+TEST_DIRECTORIES: FrozenSet[str] = frozenset({'test', 'tests', 'spec', 'specs', 'testing'})
+
+# Common directories to skip
+SKIP_DIRECTORIES: FrozenSet[str] = frozenset({
+    # Dependencies
+    'node_modules', 'venv', '.venv', 'env', '.env', 'virtualenv', '.virtualenv',
+    'vendor', 'bower_components', 'jspm_packages', 'packages',
+    'target', 'build', 'dist', 'out', 'output', 'bin', 'obj',
+    # Tests
+    'test', 'tests', 'spec', 'specs', 'testing',
+    # Version control
+    '.git', '.svn', '.hg', '.bzr',
+    # IDE and editor files
+    '.idea', '.vscode', '.vs', '.eclipse', '.settings',
+    # Cache and temporary files
+    '__pycache__', '.cache', 'tmp', 'temp', '.tmp', '.temp',
+    # Documentation
+    'docs', 'doc', 'documentation',
+    # Generated files
+    'generated', 'gen', 'auto-generated',
+    # Other
+    '.github', '.gitlab', 'coverage', '.coverage', 'htmlcov'
+})
+
+# Matches the names of directories to skip: the names above, hidden directories,
+# and integration test directories
+_SKIP_DIRECTORY_MATCH = re.compile(
+    r'\.'
+    r'|(?:' + '|'.join(map(re.escape, sorted(SKIP_DIRECTORIES))) + r')\Z'
+    r'|.*(?:tests_integration|integration_tests)',
+    re.IGNORECASE
+).match
+
+# Directories with more subdirectories than this are scanned in parallel
+PARALLEL_SUBDIRECTORY_THRESHOLD = 4
+
+# Number of paths written to stdout per write call
+OUTPUT_BATCH_SIZE = 1024
+
+
+def existing_directory(value: str) -> str:
+    """Validate a command-line argument that must name an existing directory.
+
+    Args:
+        value: Raw argument value.
+
+    Returns:
+        The unchanged value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an existing directory.
+    """
+    if not os.path.isdir(value):
+        raise argparse.ArgumentTypeError(f"'{value}' is not an existing directory")
+    return value
 
 
 def parse_args() -> argparse.Namespace:
@@ -27,7 +170,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Find source files in a directory")
     parser.add_argument(
         "--directory",
-        type=str,
+        type=existing_directory,
         required=False,
         default="/src",
         help="Directory to search for source files (default: /src)"
@@ -44,50 +187,25 @@ def is_config_file(file_path: Path) -> bool:
     Returns:
         True if the file is a configuration file, False otherwise.
     """
-    # Common configuration file names and patterns
-    config_file_names = {
-        # General config files
-        'config.js', 'config.ts', 'config.json', 'config.yaml', 'config.yml',
-        'config.toml', 'config.ini', 'config.xml', 'config.env',
-        # Package managers
-        'package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml',
-        'composer.json', 'composer.lock', 'Gemfile', 'Gemfile.lock',
-        'requirements.txt', 'pyproject.toml', 'poetry.lock', 'Pipfile', 'Pipfile.lock',
-        # Build tools
-        'webpack.config.js', 'rollup.config.js', 'vite.config.js', 'babel.config.js',
-        'tsconfig.json', 'tslint.json', 'eslintrc.js', '.eslintrc.js', '.eslintrc.json',
-        'jest.config.js', 'vitest.config.js', 'karma.conf.js',
-        # CI/CD
-        '.travis.yml', '.gitlab-ci.yml', '.github/workflows/main.yml',
-        'Jenkinsfile', 'azure-pipelines.yml', 'bitbucket-pipelines.yml',
-        # Docker
-        'Dockerfile', 'docker-compose.yml', 'docker-compose.yaml',
-        # Other
-        '.env', '.env.example', '.env.local', '.env.development', '.env.production',
-        '.gitignore', '.gitattributes', '.editorconfig', '.prettierrc', '.prettierrc.js',
-        'README.md', 'LICENSE', 'CHANGELOG.md', 'CONTRIBUTING.md'
-    }
+    return _is_config_name(file_path.name)
+
+
+def _is_config_name(file_name: str) -> bool:
+    """Check if a bare file name belongs to a configuration file.
+
+    Args:
+        file_name: Name of the file, without any directory part.
 
+    Returns:
+        True if the name is a configuration file name, False otherwise.
+    """
     # Check if the file name matches a known config file
-    if file_path.name in config_file_names:
+    if file_name in CONFIG_FILE_NAMES:
         return True
 
     # Check for common config file patterns
-    config_patterns = [
-        # Config files with .config. in the name
-        '.config.',
-        # Files starting with dot
-        '.eslintrc', '.babelrc', '.stylelintrc',
-        # Common config file suffixes
-        'rc.js', 'rc.json', 'rc.yaml', 'rc.yml',
-        # Test config files
-        'test.config.', 'jest.config.', 'vitest.config.', 'karma.config.',
-        # Build config files
-        'webpack.', 'rollup.', 'vite.', 'babel.', 'postcss.config.'
-    ]
-
-    for pattern in config_patterns:
-        if pattern in file_path.name:
+    for pattern in CONFIG_FILE_PATTERNS:
+        if pattern in file_name:
             return True
 
     return False
@@ -115,31 +233,49 @@ def is_test_file(file_path: Path) -> bool:
     Returns:
         True if the file is a test file, False otherwise.
     """
-    # Common test file patterns
-    test_patterns = [
-        'test_', 'tests_', '_test', '_tests',
-        'spec_', 'specs_', '_spec', '_specs',
-        '.test.', '.spec.', '-test.', '-spec.'
-    ]
-
-    # Check if the file name starts with or contains test patterns
-    file_name = file_path.stem.lower()
-    full_name = file_path.name.lower()
-    for pattern in test_patterns:
-        if pattern in file_name or pattern in full_name:
-            return True
+    if _is_test_name(file_path.name.lower()):
+        return True
 
     # Check if the file is in a test directory
     for part in file_path.parts:
-        if part.lower() in {'test', 'tests', 'spec', 'specs', 'testing'}:
+        if part.lower() in TEST_DIRECTORIES:
+            return True
+        if _is_integration_test_directory(part):
             return True
-        # Check for integration test directories
-        if 'tests_integration' in part.lower() or 'integration_tests' in part.lower():
+
+    return False
+
+
+def _is_test_name(lowered_name: str) -> bool:
+    """Check if a bare file name matches a test file naming pattern.
+
+    Args:
+        lowered_name: Lowercased name of the file, without any directory part.
+
+    Returns:
+        True if the name looks like a test file, False otherwise.
+    """
+    # The stem is a prefix of the full name, so checking the full name covers both
+    for pattern in TEST_FILE_PATTERNS:
+        if pattern in lowered_name:
             return True
 
     return False
 
 
+def _is_integration_test_directory(dir_name: str) -> bool:
+    """Check if a directory name denotes an integration test directory.
+
+    Args:
+        dir_name: Name of the directory.
+
+    Returns:
+        True if the directory holds integration tests, False otherwise.
+    """
+    dir_name = dir_name.lower()
+    return 'tests_integration' in dir_name or 'integration_tests' in dir_name
+
+
 def is_source_file(file_path: Path) -> bool:
     """Check if a file is a source file.
 
@@ -149,40 +285,6 @@ def is_source_file(file_path: Path) -> bool:
     Returns:
         True if the file is a source file, False otherwise.
     """
-    # Common source file extensions for various programming languages
-    source_extensions = {
-        # Python
-        '.py', '.pyx', '.pyi',
-        # JavaScript/TypeScript
-        '.js', '.jsx', '.ts', '.tsx',
-        # Java
-        '.java',
-        # C/C++
-        '.c', '.cpp', '.cc', '.cxx', '.h', '.hpp', '.hxx',
-        # C#
-        '.cs',
-        # Go
-        '.go',
-        # Ruby
-        '.rb',
-        # PHP
-        '.php',
-        # Swift
-        '.swift',
-        # Kotlin
-        '.kt', '.kts',
-        # Rust
-        '.rs',
-        # Scala
-        '.scala',
-        # Shell
-        '.sh', '.bash',
-        # HTML/CSS (sometimes considered source)
-        '.html', '.htm', '.css',
-        # Other
-        '.r', '.pl', '.pm', '.lua', '.groovy', '.dart', '.elm'
-    }
-
     # First check if it's a config file - if so, it's not a source file
     if is_config_file(file_path):
         return False
@@ -201,89 +303,159 @@ def is_source_file(file_path: Path) -> bool:
             return False
 
     # Otherwise, check if it has a source file extension
-    return file_path.suffix.lower() in source_extensions
+    return file_path.suffix.lower() in SOURCE_EXTENSIONS
+
+
+def _is_source_name(file_name: str) -> bool:
+    """Check if a bare file name belongs to a source file.
+
+    Directory-level exclusions are not applied; callers are expected to have
+    pruned skipped directories already.
+
+    Args:
+        file_name: Name of the file, without any directory part.
+
+    Returns:
+        True if the name is a source file name, False otherwise.
+    """
+    if file_name.startswith('.'):
+        return False
+
+    # Source file names are usually lowercase already, so skip the copy then
+    lowered = file_name if file_name.islower() else file_name.lower()
+    if not lowered.endswith(SOURCE_SUFFIXES):
+        return False
 
+    return not _is_config_name(file_name) and not _is_test_name(lowered)
 
-def should_skip_directory(dir_path: Path) -> bool:
+
+def should_skip_directory(dir_path: Union[str, Path]) -> bool:
     """Check if a directory should be skipped.
 
+    Only the directory's own name is checked; parent directories are expected
+    to have been checked already while descending into them.
+
     Args:
-        dir_path: Path to the directory.
+        dir_path: Path to the directory, or its bare name.
 
     Returns:
         True if the directory should be skipped, False otherwise.
     """
-    # Common directories to skip
-    skip_dirs = {
-        # Dependencies
-        'node_modules', 'venv', '.venv', 'env', '.env', 'virtualenv', '.virtualenv',
-        'vendor', 'bower_components', 'jspm_packages', 'packages',
-        'target', 'build', 'dist', 'out', 'output', 'bin', 'obj',
-        # Tests
-        'test', 'tests', 'spec', 'specs', 'testing',
-        # Version control
-        '.git', '.svn', '.hg', '.bzr',
-        # IDE and editor files
-        '.idea', '.vscode', '.vs', '.eclipse', '.settings',
-        # Cache and temporary files
-        '__pycache__', '.cache', 'tmp', 'temp', '.tmp', '.temp',
-        # Documentation
-        'docs', 'doc', 'documentation',
-        # Generated files
-        'generated', 'gen', 'auto-generated',
-        # Other
-        '.github', '.gitlab', 'coverage', '.coverage', 'htmlcov'
-    }
-
-    # Check if the directory name should be skipped
-    if dir_path.name.lower() in skip_dirs:
-        return True
+    return _SKIP_DIRECTORY_MATCH(os.path.basename(dir_path)) is not None
 
-    # Check if the directory name starts with a dot (hidden directory)
-    if dir_path.name.startswith('.'):
-        return True
 
-    # Check if any parent directory in the path should be skipped
-    for part in dir_path.parts:
-        if part.lower() in skip_dirs:
-            return True
-        # Check if any parent directory starts with a dot
-        if part.startswith('.'):
-            return True
+def _scan_directory(directory: str) -> Tuple[List[str], List[str]]:
+    """Scan a single directory for source files and subdirectories to descend into.
 
-    return False
+    Excluded directories are pruned here, so files only need their bare name
+    checked. Unreadable directories are treated as empty, as os.walk does.
+    Symbolic links are never followed, neither to directories (which could
+    form cycles) nor to files.
 
+    Args:
+        directory: Directory to scan.
 
-def find_source_files(directory: str) -> List[str]:
-    """Find source files in a directory.
+    Returns:
+        Tuple of the source files and the subdirectories that are not skipped.
+    """
+    source_files = []
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not should_skip_directory(entry.name):
+                            subdirectories.append(entry.path)
+                    elif (entry.is_file(follow_symlinks=False)
+                          and _is_source_name(entry.name)):
+                        source_files.append(entry.path)
+                except OSError:
+                    # The entry vanished or cannot be stat'ed; leave it out
+                    continue
+    except OSError as e:
+        logger.debug(f"Skipping unreadable directory '{directory}': {e}")
+
+    # scandir returns entries in file system order; sort them so every run
+    # finds the same files in the same order
+    source_files.sort()
+    subdirectories.sort()
+    return source_files, subdirectories
+
+
+def _scan_subtree(directory: str) -> Tuple[List[str], List[str]]:
+    """Scan a directory tree, handing wide directories back for parallel scanning.
+
+    Narrow directories are descended into inline since scheduling them on the
+    thread pool would cost more than scanning them.
 
     Args:
-        directory: Directory to search for source files.
+        directory: Root of the subtree to scan.
 
     Returns:
-        List of source files.
+        Tuple of the source files found and the directories left to scan.
     """
     source_files = []
-    dir_path = Path(directory).resolve()
+    deferred_dirs = []
+    pending = [directory]
+    while pending:
+        directory_files, subdirectories = _scan_directory(pending.pop())
+        source_files.extend(directory_files)
+        if len(subdirectories) > PARALLEL_SUBDIRECTORY_THRESHOLD:
+            deferred_dirs.extend(subdirectories)
+        else:
+            # Reversed so that pop() descends into them in sorted order
+            pending.extend(reversed(subdirectories))
 
-    if not dir_path.exists():
-        logger.error(f"Error: Directory '{directory}' does not exist.")
-        return []
+    return source_files, deferred_dirs
 
-    if not dir_path.is_dir():
-        logger.error(f"Error: '{directory}' is not a directory.")
-        return []
 
-    for root, dirs, files in os.walk(dir_path):
-        # Skip directories that should be excluded
-        dirs[:] = [d for d in dirs if not should_skip_directory(Path(root) / d)]
+def iter_source_files(directory: str) -> Iterator[str]:
+    """Find source files in a directory, yielding each one as soon as it is found.
+
+    Args:
+        directory: Directory to search for source files.
 
-        for file in files:
-            file_path = Path(root) / file
-            if is_source_file(file_path):
-                source_files.append(str(file_path))
+    Yields:
+        Paths of the source files.
+    """
+    dir_path = os.path.abspath(directory)
+
+    if not os.path.isdir(dir_path):
+        if os.path.exists(dir_path):
+            logger.error(f"Error: '{directory}' is not a directory.")
+        else:
+            logger.error(f"Error: Directory '{directory}' does not exist.")
+        return
+
+    # Subtrees are scanned concurrently; scandir releases the GIL while it
+    # waits on the file system. Results are taken in submission order rather
+    # than completion order, so the files always come out in the same order
+    executor = ThreadPoolExecutor()
+    try:
+        pending = deque([executor.submit(_scan_subtree, dir_path)])
+        while pending:
+            subtree_files, deferred_dirs = pending.popleft().result()
+            pending.extend(
+                executor.submit(_scan_subtree, deferred_dir)
+                for deferred_dir in deferred_dirs
+            )
+            yield from subtree_files
+    finally:
+        # A consumer that stops early should not keep the rest of the tree scanning
+        executor.shutdown(cancel_futures=True)
 
-    return source_files
+
+def find_source_files(directory: str) -> List[str]:
+    """Find source files in a directory.
+
+    Args:
+        directory: Directory to search for source files.
+
+    Returns:
+        List of source files.
+    """
+    return list(iter_source_files(directory))
 
 
 def main() -> int:
@@ -295,10 +467,13 @@ def main() -> int:
     try:
         args = parse_args()
 
-        source_files = find_source_files(args.directory)
-
-        for file in source_files:
-            logger.info(file)
+        source_files = iter_source_files(args.directory)
+        while True:
+            batch = list(islice(source_files, OUTPUT_BATCH_SIZE))
+            if not batch:
+                break
+            sys.stdout.write("\n".join(batch) + "\n")
+        sys.stdout.flush()
 
         return 0
     except Exception as e:
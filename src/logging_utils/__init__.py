@@ -1,68 +1,106 @@
 """
 Logging configuration and utility functions for the Usual Suspects application.
-Provides a centralized logging setup with YAML configuration and convenience methods.
+Provides a centralized logging setup with JSON configuration and convenience methods.
 """
 
+import functools
+import json
 import logging
 import logging.config
 import os
-from typing import Any
-
-import yaml
+import threading
+from typing import Any, Dict
 
 # Setup paths
 script_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(script_dir)
-logging_config_path = os.path.join(parent_dir, 'logging.yaml')
+logging_config_path = os.path.join(parent_dir, 'logging.json')
 
 isInitialized = False
+_init_lock = threading.Lock()
+
+
+def _load_logging_config() -> Dict[str, Any]:
+    """Load the logging configuration from the JSON file."""
+    with open(logging_config_path, 'rt') as f:
+        return json.load(f)
 
 
 def init_logging() -> None:
-    """Initialize logging configuration from YAML file."""
+    """Initialize logging configuration from the JSON config file."""
     global isInitialized
-    if isInitialized:
-        return
-    isInitialized = True
-    try:
-        with open(logging_config_path, 'rt') as f:
-            config = yaml.safe_load(f.read())
-        logging.config.dictConfig(config)
-    except Exception as e:
-        # Fallback to basic configuration if YAML loading fails
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        logging.error(f"Failed to load logging config from {logging_config_path}: {e}")
+    with _init_lock:
+        if isInitialized:
+            return
+        isInitialized = True
+        try:
+            logging.config.dictConfig(_load_logging_config())
+        except Exception as e:
+            # Fallback to basic configuration if loading the config fails
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            logging.error(f"Failed to load logging config from {logging_config_path}: {e}")
 
 
 def get_logger(name: str = "tfc-code-pipeline") -> logging.Logger:
     """
     Get a logger instance with the specified name.
 
+    Logging is configured on the first call.
+
     Args:
         name: Logger name, defaults to "usual-suspects"
 
     Returns:
         logging.Logger: Configured logger instance
     """
+    if not isInitialized:
+        init_logging()
     return logging.getLogger(name)
 
 
+class LazyLogger:
+    """
+    Logger that is only looked up, and logging only configured, when it is first used.
+
+    Modules create one at import time so that importing them does not load the logging config.
+    """
+
+    def __init__(self, name: str = "tfc-code-pipeline") -> None:
+        """
+        Initialize the lazy logger.
+
+        Args:
+            name: Name of the logger to look up on first use
+        """
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        """Forward attribute access to the real logger."""
+        return getattr(get_logger(self._name), attr)
+
+
+@functools.cache
+def _default_logger() -> logging.Logger:
+    """Get the default application logger, resolved once and reused by the log_* helpers."""
+    return get_logger()
+
+
 def log_info(*args: Any) -> None:
     """Log an INFO level message."""
-    get_logger().info(*args)
+    _default_logger().info(*args)
 
 
 def log_debug(*args: Any) -> None:
     """Log a DEBUG level message."""
-    get_logger().debug(*args)
+    _default_logger().debug(*args)
 
 
 def log_warn(*args: Any) -> None:
     """Log a WARNING level message."""
-    get_logger().warning(*args)
+    _default_logger().warning(*args)
 
 
 def log_error(*args: Any, **kwargs: Any) -> None:
@@ -73,7 +111,7 @@ def log_error(*args: Any, **kwargs: Any) -> None:
         *args: Message and arguments to log
         **kwargs: Additional logging parameters (e.g., exc_info, stack_info)
     """
-    get_logger().error(*args, **kwargs)
+    _default_logger().error(*args, **kwargs)
 
 
 def log_exception(*args: Any, **kwargs: Any) -> None:
@@ -84,8 +122,4 @@ def log_exception(*args: Any, **kwargs: Any) -> None:
         *args: Message and arguments to log
         **kwargs: Additional logging parameters (e.g., exc_info, stack_info)
     """
-    get_logger().exception(*args, **kwargs)
-
-
-# Initialize logging when module is imported
-init_logging()
+    _default_logger().exception(*args, **kwargs)
@@ -7,53 +7,145 @@ component/file, and creates suggestions for improvements including prompts suita
 
 import argparse
 import json
-from collections import defaultdict
-from enum import Enum
-from typing import Dict, List
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, TextIO, Tuple
 
 from code_processor import CodeProcessor
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 from util import lcfirst
 
 # Set up logging
-logger = get_logger()
-
-
-class SeverityLevel(Enum):
-    """Enum for Sonar issue severity levels."""
-    LOW = 1
-    INFO = 2
-    MEDIUM = 3
-    HIGH = 4
-    BLOCKER = 5
-
-    @classmethod
-    def from_string(cls, severity: str) -> 'SeverityLevel':
-        """Convert a string severity to a SeverityLevel enum."""
-        severity_map = {
-            "LOW": cls.LOW,
-            "INFO": cls.INFO,
-            "MEDIUM": cls.MEDIUM,
-            "HIGH": cls.HIGH,
-            "BLOCKER": cls.BLOCKER,
-            # Map legacy severity levels for compatibility
-            "MINOR": cls.LOW,
-            "MAJOR": cls.HIGH,
-            "CRITICAL": cls.HIGH
-        }
-        return severity_map.get(severity.upper(), cls.INFO)
-
-    @classmethod
-    def to_string(cls, level: 'SeverityLevel') -> str:
-        """Convert a SeverityLevel enum to a string."""
-        severity_map = {
-            cls.LOW: "LOW",
-            cls.INFO: "INFO",
-            cls.MEDIUM: "MEDIUM",
-            cls.HIGH: "HIGH",
-            cls.BLOCKER: "BLOCKER"
-        }
-        return severity_map.get(level, "INFO")
+logger = LazyLogger()
+
+
+# Numeric rank of each Sonar severity name, keyed by the uppercase name
+SEVERITY_RANKS: Dict[str, int] = {
+    "LOW": 1,
+    "INFO": 2,
+    "MEDIUM": 3,
+    "HIGH": 4,
+    "BLOCKER": 5,
+    # Map legacy severity levels for compatibility
+    "MINOR": 1,
+    "MAJOR": 4,
+    "CRITICAL": 4
+}
+
+# Rank used for missing or unrecognized severities
+DEFAULT_SEVERITY_RANK = SEVERITY_RANKS["INFO"]
+
+# File measures read when looking for overly complex files
+COMPLEXITY_METRICS = ("complexity", "cognitive_complexity", "ncloc", "functions")
+
+# Per-file limits as (metric, threshold, reason); exceeding any marks the file as complex
+COMPLEXITY_THRESHOLDS = (
+    ("complexity", 30, "High cyclomatic complexity: {value} (threshold: {threshold})"),
+    ("cognitive_complexity", 25, "High cognitive complexity: {value} (threshold: {threshold})"),
+    ("ncloc", 500, "Large file size: {value} lines of code (threshold: {threshold})"),
+)
+
+# Limit on the average cyclomatic complexity per function
+COMPLEXITY_PER_FUNCTION_THRESHOLD = 5
+
+# Minimum number of components before --parallel starts worker processes
+PARALLEL_COMPONENT_THRESHOLD = 200
+
+# Number of components sent to a worker process at a time
+PARALLEL_CHUNK_SIZE = 32
+
+
+@lru_cache(maxsize=16)
+def _severity_rank(severity: str) -> int:
+    """
+    Look up the rank of a severity name regardless of its case.
+
+    Args:
+        severity: The severity name as found in the report
+
+    Returns:
+        The numeric rank, or DEFAULT_SEVERITY_RANK for unknown names
+    """
+    return SEVERITY_RANKS.get(severity.upper(), DEFAULT_SEVERITY_RANK)
+
+
+# Improvement areas in priority order as (rule codes, message keywords, suggestion).
+# A rule belongs to the first area whose rule codes or keywords match it.
+IMPROVEMENT_AREAS: Tuple[Tuple[FrozenSet[str], Tuple[str, ...], str], ...] = (
+    (frozenset({"S3776"}), ("complexity", "cognitive"),
+     "Improve code maintainability by reducing complexity"),
+    (frozenset({"S1192", "S1871"}), ("duplicate", "identical"),
+     "Enhance code structure by eliminating duplications"),
+    (frozenset({"S1172", "S1144"}), ("unused", "never used"),
+     "Clean up codebase by removing unused elements"),
+    (frozenset(), ("security", "vulnerability"),
+     "Strengthen security posture"),
+    (frozenset({"S112", "S1313"}), ("bug", "exception"),
+     "Improve code reliability"),
+    (frozenset(), ("smell", "refactor"),
+     "Enhance code quality"),
+    (frozenset(), ("naming", "name"),
+     "Improve code readability"),
+    (frozenset(), ("documentation", "comment", "doc"),
+     "Enhance code documentation"),
+    (frozenset(), ("coverage", "test"),
+     "Improve test coverage"),
+    (frozenset(), ("format", "spacing", "indent"),
+     "Standardize code formatting"),
+)
+
+# Rule code prefix that marks a rule as security related, and the area it maps to
+SECURITY_RULE_PREFIX = "S1"
+SECURITY_AREA = 3
+
+# Area of each rule code listed in IMPROVEMENT_AREAS, for a single lookup per rule
+_RULE_CODE_AREAS: Dict[str, int] = {
+    rule_code: area
+    for area, (rule_codes, _, _) in enumerate(IMPROVEMENT_AREAS)
+    for rule_code in rule_codes
+}
+
+
+def _strip_key_prefix(key: str) -> str:
+    """
+    Strip the project or repository prefix from a Sonar key.
+
+    Args:
+        key: A component key such as "project:src/main.py" or a rule key such as
+            "python:S3776"
+
+    Returns:
+        The part after the last colon, or the key itself if it has no colon
+    """
+    return key.rpartition(':')[2]
+
+
+def _categorize_rule(rule_code: str, sample_message: str) -> Optional[int]:
+    """
+    Find the improvement area a rule belongs to.
+
+    Args:
+        rule_code: The rule code without its repository prefix, e.g. "S3776"
+        sample_message: An issue message reported for the rule
+
+    Returns:
+        The index of the area in IMPROVEMENT_AREAS, or None if no area applies
+    """
+    code_area = _RULE_CODE_AREAS.get(rule_code, len(IMPROVEMENT_AREAS))
+    if code_area > SECURITY_AREA and rule_code.startswith(SECURITY_RULE_PREFIX):
+        code_area = SECURITY_AREA
+
+    # Only areas ranked above the one matched by the rule code can still win; the
+    # message is only lowercased when there is such an area to check
+    if code_area:
+        sample_message = sample_message.lower()
+    for area in range(code_area):
+        for keyword in IMPROVEMENT_AREAS[area][1]:
+            if keyword in sample_message:
+                return area
+
+    return code_area if code_area < len(IMPROVEMENT_AREAS) else None
 
 
 class SonarAnalyzerProcessor(CodeProcessor):
@@ -95,6 +187,21 @@ class SonarAnalyzerProcessor(CodeProcessor):
             help="Path to the output file for the analysis results (default: stdout)",
         )
 
+        parser.add_argument(
+            "--skip-complexity",
+            action="store_true",
+            help="Only analyze issues and skip the file complexity measures",
+        )
+
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help=(
+                "Generate suggestions in worker processes when the report has more than "
+                f"{PARALLEL_COMPONENT_THRESHOLD} components with issues"
+            ),
+        )
+
     def process_files(self, args: argparse.Namespace) -> List[str]:
         """Process the Sonar scanner report and generate improvement suggestions.
 
@@ -108,25 +215,28 @@ class SonarAnalyzerProcessor(CodeProcessor):
         logger.info(f"Analyzing Sonar scanner report: {report_file}")
         logger.info(f"Minimum severity level: {min_severity}")
 
-        # Load the Sonar scanner report
+        # Load the Sonar scanner report; json decodes the raw bytes in one pass,
+        # without going through a text-mode wrapper first
         try:
-            with open(report_file, 'r') as f:
-                report_data = json.load(f)
+            with open(report_file, 'rb') as f:
+                report_data = json.loads(f.read())
         except Exception as e:
             logger.error(f"Failed to load Sonar scanner report: {e}")
             return []
 
-        # Convert min_severity to SeverityLevel enum
-        min_severity_level = SeverityLevel.from_string(min_severity)
+        # Convert min_severity to its numeric rank
+        min_rank = _severity_rank(min_severity)
 
         # Analyze the report and generate suggestions
-        suggestions = self._analyze_report(report_data, min_severity_level)
+        suggestions = self._analyze_report(
+            report_data, min_rank, args.parallel, args.skip_complexity
+        )
 
         # Output the suggestions
         if output_file:
             try:
                 with open(output_file, 'w') as f:
-                    json.dump(suggestions, f, indent=2)
+                    self._write_suggestions(f, suggestions)
                 logger.info(f"Analysis results written to: {output_file}")
             except Exception as e:
                 logger.error(f"Failed to write analysis results: {e}")
@@ -139,13 +249,16 @@ class SonarAnalyzerProcessor(CodeProcessor):
         # Return the report file to indicate successful processing
         return [report_file]
 
-    def _analyze_report(self, report_data: Dict, min_severity_level: SeverityLevel) -> Dict:
+    def _analyze_report(self, report_data: Dict, min_rank: int,
+                        parallel: bool = False, skip_complexity: bool = False) -> Dict:
         """
         Analyze the Sonar scanner report and generate improvement suggestions.
 
         Args:
             report_data: The Sonar scanner report data
-            min_severity_level: The minimum severity level to include
+            min_rank: The rank of the minimum severity level to include
+            parallel: Whether to generate suggestions in worker processes for large reports
+            skip_complexity: Whether to leave out the file complexity measures
 
         Returns:
             A dictionary of suggestions for each component/file
@@ -155,32 +268,61 @@ class SonarAnalyzerProcessor(CodeProcessor):
         # Process issues
         if 'issues' in report_data and 'issues' in report_data['issues']:
             # Group issues by component
-            issues_by_component = defaultdict(list)
+            issues_by_component: Dict[str, List[Dict]] = {}
+            group_for = issues_by_component.setdefault
+            # Severity names that pass the filter, fixed for the whole report
+            accepted = frozenset(name for name, rank in SEVERITY_RANKS.items() if rank >= min_rank)
+            intern = sys.intern
             for issue in report_data['issues']['issues']:
                 severity = issue.get('severity', 'INFO')
-                severity_level = SeverityLevel.from_string(severity)
 
-                # Skip issues below the minimum severity level
-                if severity_level.value < min_severity_level.value:
-                    continue
-
-                component = issue.get('component', '')
-                issues_by_component[component].append(issue)
+                # Skip issues below the minimum severity level; Sonar reports use
+                # uppercase names, so other spellings are only ranked as a fallback
+                if severity not in accepted:
+                    if severity in SEVERITY_RANKS or _severity_rank(severity) < min_rank:
+                        continue
+
+                # Reports repeat a few rule and severity names across all issues;
+                # share one string per name instead of keeping a copy per issue.
+                # Only strings can be interned; other values are kept as they are
+                if 'severity' in issue and isinstance(severity, str):
+                    issue['severity'] = intern(severity)
+                rule = issue.get('rule')
+                if isinstance(rule, str):
+                    issue['rule'] = intern(rule)
+
+                # A missing or null component is grouped under the empty key
+                component = issue.get('component') or ''
+                if isinstance(component, str):
+                    component = intern(component)
+                group_for(component, []).append(issue)
 
             # Generate suggestions for each component with issues
-            for component, issues in issues_by_component.items():
-                if not issues:
-                    continue
+            if parallel and len(issues_by_component) > PARALLEL_COMPONENT_THRESHOLD:
+                # Components are independent, so spread them over worker processes;
+                # map keeps the results in component order
+                with ProcessPoolExecutor() as executor:
+                    generated = list(executor.map(
+                        _generate_suggestion_worker,
+                        issues_by_component.items(),
+                        chunksize=PARALLEL_CHUNK_SIZE
+                    ))
+            else:
+                generated = [
+                    (component, self._generate_suggestion(component, issues))
+                    for component, issues in issues_by_component.items()
+                ]
 
-                # Generate a suggestion for the component based on issues
-                suggestion = self._generate_suggestion(component, issues)
+            for component, suggestion in generated:
                 if suggestion:
                     suggestions[component] = suggestion
         else:
             logger.warning("No issues found in the Sonar scanner report")
 
         # Process file measures for complexity
-        if 'file_measures' in report_data and 'components' in report_data['file_measures']:
+        if skip_complexity:
+            logger.info("Skipping file complexity analysis")
+        elif 'file_measures' in report_data and 'components' in report_data['file_measures']:
             # Analyze file complexity
             complex_files = self._analyze_file_complexity(report_data['file_measures']['components'])
 
@@ -191,7 +333,7 @@ class SonarAnalyzerProcessor(CodeProcessor):
                     suggestions[component]["complexity_data"] = complexity_data
                     suggestions[component]["prompt"] = self._combine_prompts(
                         suggestions[component]["prompt"],
-                        self._generate_complexity_prompt(component, complexity_data)
+                        self._generate_complexity_prompt(_strip_key_prefix(component), complexity_data)
                     )
                 else:
                     # Component only has complexity issues
@@ -220,90 +362,35 @@ class SonarAnalyzerProcessor(CodeProcessor):
             }
 
         # Group issues by rule
-        issues_by_rule = defaultdict(list)
+        issues_by_rule: Dict[str, List[Dict]] = {}
+        group_for = issues_by_rule.setdefault
         for issue in issues:
             rule = issue.get('rule', '')
-            issues_by_rule[rule].append(issue)
+            group_for(rule, []).append(issue)
 
-        # Generate a summary of the issues
+        # Generate a summary of the issues and, in the same pass, categorize them into
+        # high-level improvement areas based on rule codes and messages
         summary = []
+        # One bit per area in IMPROVEMENT_AREAS, set when a rule falls into it
+        matched_areas = 0
         for rule, rule_issues in issues_by_rule.items():
-            rule_summary = f"Rule: {rule} ({len(rule_issues)} issues)"
-            summary.append(rule_summary)
-
-        # Categorize issues into high-level improvement areas based on rule codes and messages
-        has_complexity_issues = False
-        has_duplications = False
-        has_unused_code = False
-        has_security_issues = False
-        has_bugs = False
-        has_code_smells = False
-        has_naming_issues = False
-        has_documentation_issues = False
-        has_coverage_issues = False
-        has_formatting_issues = False
-
-        # Check each issue for specific patterns in rule codes and messages
-        for rule, rule_issues in issues_by_rule.items():
-            rule_code = rule.split(':')[-1] if ':' in rule else rule
+            summary.append(f"Rule: {rule} ({len(rule_issues)} issues)")
+
+            rule_code = _strip_key_prefix(rule)
 
             # Get a sample message to understand the issue better
-            sample_message = rule_issues[0].get('message', '').lower()
-
-            # Check for complexity issues
-            if rule_code in ['S3776'] or 'complexity' in sample_message or 'cognitive' in sample_message:
-                has_complexity_issues = True
-            # Check for duplications
-            elif rule_code in ['S1192', 'S1871'] or 'duplicate' in sample_message or 'identical' in sample_message:
-                has_duplications = True
-            # Check for unused code
-            elif rule_code in ['S1172', 'S1144'] or 'unused' in sample_message or 'never used' in sample_message:
-                has_unused_code = True
-            # Check for security issues
-            elif rule_code.startswith('S1') or 'security' in sample_message or 'vulnerability' in sample_message:
-                has_security_issues = True
-            # Check for bugs
-            elif rule_code in ['S112', 'S1313'] or 'bug' in sample_message or 'exception' in sample_message:
-                has_bugs = True
-            # Check for code smells
-            elif 'smell' in sample_message or 'refactor' in sample_message:
-                has_code_smells = True
-            # Check for naming issues
-            elif 'naming' in sample_message or 'name' in sample_message:
-                has_naming_issues = True
-            # Check for documentation issues
-            elif 'documentation' in sample_message or 'comment' in sample_message or 'doc' in sample_message:
-                has_documentation_issues = True
-            # Check for coverage issues
-            elif 'coverage' in sample_message or 'test' in sample_message:
-                has_coverage_issues = True
-            # Check for formatting issues
-            elif 'format' in sample_message or 'spacing' in sample_message or 'indent' in sample_message:
-                has_formatting_issues = True
+            sample_message = rule_issues[0].get('message', '')
+
+            area = _categorize_rule(rule_code, sample_message)
+            if area is not None:
+                matched_areas |= 1 << area
 
         # Collect all applicable suggestions based on the categories of issues
-        suggestions_list = []
-
-        if has_complexity_issues:
-            suggestions_list.append("Improve code maintainability by reducing complexity")
-        if has_duplications:
-            suggestions_list.append("Enhance code structure by eliminating duplications")
-        if has_unused_code:
-            suggestions_list.append("Clean up codebase by removing unused elements")
-        if has_security_issues:
-            suggestions_list.append("Strengthen security posture")
-        if has_bugs:
-            suggestions_list.append("Improve code reliability")
-        if has_code_smells:
-            suggestions_list.append("Enhance code quality")
-        if has_naming_issues:
-            suggestions_list.append("Improve code readability")
-        if has_documentation_issues:
-            suggestions_list.append("Enhance code documentation")
-        if has_coverage_issues:
-            suggestions_list.append("Improve test coverage")
-        if has_formatting_issues:
-            suggestions_list.append("Standardize code formatting")
+        suggestions_list = [
+            suggestion
+            for area, (_, _, suggestion) in enumerate(IMPROVEMENT_AREAS)
+            if matched_areas >> area & 1
+        ]
 
         # Combine suggestions or use default if none apply
         if suggestions_list:
@@ -318,7 +405,7 @@ class SonarAnalyzerProcessor(CodeProcessor):
             suggestion = "Refactor code for better maintainability"
 
         # Generate a prompt for an AI Coding Agent
-        prompt = self._generate_ai_prompt(component, issues)
+        prompt = self._generate_ai_prompt(_strip_key_prefix(component), issues)
 
         return {
             "component": component,
@@ -328,41 +415,31 @@ class SonarAnalyzerProcessor(CodeProcessor):
             "prompt": prompt
         }
 
-    def _generate_ai_prompt(self, component: str, issues: List[Dict]) -> str:
+    def _generate_ai_prompt(self, file_path: str, issues: List[Dict]) -> str:
         """
         Generate a prompt for an AI Coding Agent to fix the issues.
 
         Args:
-            component: The component name
+            file_path: The file path of the component, without its project prefix
             issues: The list of issues for the component
 
         Returns:
             A prompt string
         """
-        # Extract the file path from the component
-        file_path = component.split(':')[-1] if ':' in component else component
-
-        # Generate a detailed description of the issues
-        issues_description = []
-        for i, issue in enumerate(issues, 1):
-            rule = issue.get('rule', '')
-            severity = issue.get('severity', 'INFO')
-            line = issue.get('line', 'N/A')
-            message = issue.get('message', 'No description available')
-
-            issue_desc = (
-                f"Issue {i}:\n"
-                f"  Rule: {rule}\n"
-                f"  Severity: {severity}\n"
-                f"  Line: {line}\n"
-                f"  Message: {message}"
-            )
-            issues_description.append(issue_desc)
+        # Generate a detailed description of the issues, one block per issue
+        issues_description = "\n".join(
+            f"Issue {i}:\n"
+            f"  Rule: {issue.get('rule', '')}\n"
+            f"  Severity: {issue.get('severity', 'INFO')}\n"
+            f"  Line: {issue.get('line', 'N/A')}\n"
+            f"  Message: {issue.get('message', 'No description available')}"
+            for i, issue in enumerate(issues, 1)
+        )
 
         # Create the prompt
         prompt = (
             f"Please fix the following Sonar scanner issues in the file '{file_path}':\n\n"
-            f"{chr(10).join(issues_description)}\n\n"
+            f"{issues_description}\n\n"
             f"Please provide the necessary code changes to fix these issues, "
             f"following best practices and maintaining the existing functionality."
         )
@@ -379,64 +456,42 @@ class SonarAnalyzerProcessor(CodeProcessor):
         Returns:
             Dictionary of complex files with their complexity metrics
         """
-        # Define thresholds for complexity
-        COMPLEXITY_THRESHOLD = 30  # Cyclomatic complexity
-        COGNITIVE_COMPLEXITY_THRESHOLD = 25  # Cognitive complexity
-        NCLOC_THRESHOLD = 500  # Number of lines of code
-
         complex_files = {}
 
         for component in components:
             key = component.get('key', '')
             measures = component.get('measures', [])
 
-            # Extract complexity metrics
-            complexity = None
-            cognitive_complexity = None
-            ncloc = None
-            functions = None
-
+            # Extract complexity metrics; a repeated metric keeps its last value
+            values = {}
             for measure in measures:
                 metric = measure.get('metric', '')
-                value = measure.get('value', '0')
+                if metric in COMPLEXITY_METRICS:
+                    value = measure.get('value', '0')
+                    values[metric] = int(value) if value.isdigit() else 0
 
-                if metric == 'complexity':
-                    complexity = int(value) if value.isdigit() else 0
-                elif metric == 'cognitive_complexity':
-                    cognitive_complexity = int(value) if value.isdigit() else 0
-                elif metric == 'ncloc':
-                    ncloc = int(value) if value.isdigit() else 0
-                elif metric == 'functions':
-                    functions = int(value) if value.isdigit() else 0
+            complexity = values.get('complexity')
+            cognitive_complexity = values.get('cognitive_complexity')
+            ncloc = values.get('ncloc')
+            functions = values.get('functions')
 
             # Check if the file is complex
-            is_complex = False
-            complexity_reasons = []
-
-            if complexity and complexity > COMPLEXITY_THRESHOLD:
-                is_complex = True
-                complexity_reasons.append(
-                    f"High cyclomatic complexity: {complexity} (threshold: {COMPLEXITY_THRESHOLD})")
-
-            if cognitive_complexity and cognitive_complexity > COGNITIVE_COMPLEXITY_THRESHOLD:
-                is_complex = True
-                complexity_reasons.append(
-                    f"High cognitive complexity: {cognitive_complexity} (threshold: {COGNITIVE_COMPLEXITY_THRESHOLD})")
-
-            if ncloc and ncloc > NCLOC_THRESHOLD:
-                is_complex = True
-                complexity_reasons.append(f"Large file size: {ncloc} lines of code (threshold: {NCLOC_THRESHOLD})")
+            complexity_reasons = [
+                reason.format(value=values[metric], threshold=threshold)
+                for metric, threshold, reason in COMPLEXITY_THRESHOLDS
+                if values.get(metric) and values[metric] > threshold
+            ]
 
             # Calculate complexity per function if possible
             complexity_per_function = None
             if complexity and functions and functions > 0:
                 complexity_per_function = complexity / functions
-                if complexity_per_function > 5:  # Threshold for complexity per function
-                    is_complex = True
+                if complexity_per_function > COMPLEXITY_PER_FUNCTION_THRESHOLD:
                     complexity_reasons.append(
-                        f"High average complexity per function: {complexity_per_function:.2f} (threshold: 5)")
+                        f"High average complexity per function: {complexity_per_function:.2f} "
+                        f"(threshold: {COMPLEXITY_PER_FUNCTION_THRESHOLD})")
 
-            if is_complex:
+            if complexity_reasons:
                 complex_files[key] = {
                     "complexity": complexity,
                     "cognitive_complexity": cognitive_complexity,
@@ -481,7 +536,7 @@ class SonarAnalyzerProcessor(CodeProcessor):
             suggestion = "Improve code maintainability"
 
         # Generate a prompt
-        prompt = self._generate_complexity_prompt(component, complexity_data)
+        prompt = self._generate_complexity_prompt(_strip_key_prefix(component), complexity_data)
 
         return {
             "component": component,
@@ -492,20 +547,17 @@ class SonarAnalyzerProcessor(CodeProcessor):
             "issues_count": 0  # No Sonar issues, only complexity
         }
 
-    def _generate_complexity_prompt(self, component: str, complexity_data: Dict) -> str:
+    def _generate_complexity_prompt(self, file_path: str, complexity_data: Dict) -> str:
         """
         Generate a prompt for refactoring a complex file.
 
         Args:
-            component: The component name
+            file_path: The file path of the component, without its project prefix
             complexity_data: Complexity metrics and reasons
 
         Returns:
             A prompt string
         """
-        # Extract the file path from the component
-        file_path = component.split(':')[-1] if ':' in component else component
-
         # Extract complexity metrics
         complexity = complexity_data.get('complexity', 'N/A')
         cognitive_complexity = complexity_data.get('cognitive_complexity', 'N/A')
@@ -579,6 +631,31 @@ class SonarAnalyzerProcessor(CodeProcessor):
             f"{complexity_prompt}"
         )
 
+    def _write_suggestions(self, output: TextIO, suggestions: Dict) -> None:
+        """
+        Write the suggestions as an indented JSON object, one component at a time.
+
+        The result is identical to json.dump(suggestions, output, indent=2), but only a
+        single component is serialized at any time, so the full document, prompts
+        included, is never held in memory next to the suggestions themselves.
+
+        Args:
+            output: The text stream to write to
+            suggestions: The suggestions dictionary
+        """
+        if not suggestions:
+            output.write("{}")
+            return
+
+        separator = "{\n  "
+        for component, suggestion in suggestions.items():
+            # JSON strings escape their newlines, so every raw newline starts a
+            # line that has to be indented one level deeper
+            entry = json.dumps(suggestion, indent=2).replace("\n", "\n  ")
+            output.write(f"{separator}{json.dumps(component)}: {entry}")
+            separator = ",\n  "
+        output.write("\n}")
+
     def _print_suggestions(self, suggestions: Dict) -> None:
         """
         Print the suggestions to stdout.
@@ -590,37 +667,54 @@ class SonarAnalyzerProcessor(CodeProcessor):
             print("No suggestions generated.")
             return
 
-        print(f"Generated {len(suggestions)} suggestions:")
-        print()
+        # Collect the whole report and write it at once rather than printing line by line
+        lines = [f"Generated {len(suggestions)} suggestions:", ""]
+        add = lines.append
 
         for component, suggestion in suggestions.items():
-            print(f"Component: {component}")
+            add(f"Component: {component}")
 
             # Print issues information if available
             if 'issues_count' in suggestion:
-                print(f"Issues Count: {suggestion['issues_count']}")
+                add(f"Issues Count: {suggestion['issues_count']}")
 
             # Print complexity information if available
             if 'complexity_data' in suggestion:
                 complexity_data = suggestion['complexity_data']
-                print("Complexity Metrics:")
-                print(f"  - Cyclomatic complexity: {complexity_data.get('complexity', 'N/A')}")
-                print(f"  - Cognitive complexity: {complexity_data.get('cognitive_complexity', 'N/A')}")
-                print(f"  - Lines of code: {complexity_data.get('ncloc', 'N/A')}")
-                print(f"  - Functions: {complexity_data.get('functions', 'N/A')}")
+                add("Complexity Metrics:")
+                add(f"  - Cyclomatic complexity: {complexity_data.get('complexity', 'N/A')}")
+                add(f"  - Cognitive complexity: {complexity_data.get('cognitive_complexity', 'N/A')}")
+                add(f"  - Lines of code: {complexity_data.get('ncloc', 'N/A')}")
+                add(f"  - Functions: {complexity_data.get('functions', 'N/A')}")
                 if complexity_data.get('complexity_per_function') is not None:
-                    print(f"  - Complexity per function: {complexity_data.get('complexity_per_function'):.2f}")
+                    add(f"  - Complexity per function: {complexity_data.get('complexity_per_function'):.2f}")
 
             # Print summary
-            print("Summary:")
+            add("Summary:")
             for summary_item in suggestion['summary']:
-                print(f"  - {summary_item}")
+                add(f"  - {summary_item}")
+
+            add(f"Suggestion: {suggestion['suggestion']}")
+            add("Prompt for AI Coding Agent:")
+            add(f"{suggestion['prompt']}")
+            add("-" * 80)
+            add("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _generate_suggestion_worker(item: Tuple[str, List[Dict]]) -> Tuple[str, Dict]:
+    """
+    Generate the suggestion for one component in a worker process.
+
+    Args:
+        item: The component name and its list of issues
 
-            print(f"Suggestion: {suggestion['suggestion']}")
-            print("Prompt for AI Coding Agent:")
-            print(f"{suggestion['prompt']}")
-            print("-" * 80)
-            print()
+    Returns:
+        The component name and the generated suggestion
+    """
+    component, issues = item
+    return component, SonarAnalyzerProcessor()._generate_suggestion(component, issues)
 
 
 def main():
@@ -4,20 +4,34 @@ Processor to run sonar-scanner on the whole codebase.
 """
 
 import argparse
+import hashlib
 import json
+import logging
 import os
+import shlex
 import subprocess
 import sys
-from typing import List, Optional
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional
 
-from ai import categorize_files_openrouter_xml
 from code_processor import CodeProcessor
-from find_source_files import find_source_files as find_files
-from logging_utils import get_logger
-from sonar_scanner.client import SonarQubeClient
+from find_source_files import iter_source_files
+from logging_utils import LazyLogger
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
+
+# Number of file paths sent to OpenRouter in a single categorization request
+CATEGORIZATION_CHUNK_SIZE = 200
+
+# Maximum number of categorization requests in flight at the same time
+CATEGORIZATION_WORKERS = 8
+
+# Directory where SonarQube API responses are kept between runs when --cache-ttl is set
+API_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tfc-sonar")
 
 
 class SonarScannerProcessor(CodeProcessor):
@@ -29,34 +43,63 @@ class SonarScannerProcessor(CodeProcessor):
     def get_default_message(self) -> str:
         pass
 
-    def _create_sonar_properties_file(self, directory: str, args: argparse.Namespace) -> None:
+    def _read_ce_task_id(self, directory: str) -> Optional[str]:
+        """Read the ID of the background task that processes the report sonar-scanner submitted.
+
+        Args:
+            directory: Directory sonar-scanner ran in.
+
+        Returns:
+            The task ID, or None if the scanner did not leave a report-task.txt file.
+        """
+        report_task_path = os.path.join(directory, ".scannerwork", "report-task.txt")
+        try:
+            with open(report_task_path, encoding="utf-8") as f:
+                for line in f:
+                    key, _, value = line.partition("=")
+                    if key == "ceTaskId":
+                        return value.strip()
+        except OSError as e:
+            logger.warning(f"Could not read {report_task_path}: {e}")
+        return None
+
+    def _create_sonar_properties_file(self, directory: str, project_key: str, sonar_token: str,
+                                      analysis_cache: bool = True) -> None:
         """Create a sonar-project.properties file in the source directory.
 
         Args:
             directory: Directory where the file will be created.
-            args: Parsed command-line arguments namespace.
+            project_key: SonarQube project key, the name of the original source directory.
+            sonar_token: SonarQube token, from --login or the SONAR_TOKEN environment variable.
+            analysis_cache: Whether the scanner may skip files unchanged since the last
+                analysis; False for --no-cache.
         """
-        # Get the name of the original source directory from environment variables
-        # If not available, fall back to the name of the current directory
-        source_dir_name = os.environ.get("ORIGINAL_SRC_DIR_NAME", os.path.basename(os.path.abspath(directory)))
-
-        # Get the SONAR_TOKEN from command-line arguments or environment variables
-        sonar_token = args.login if hasattr(args, 'login') and args.login else os.environ.get("SONAR_TOKEN", "")
-
-        # Create the content for the sonar-project.properties file
-        content = f"""sonar.projectKey={source_dir_name}
+        # Create the content for the sonar-project.properties file, encoded up front so
+        # it is written and compared byte for byte, without newline translation
+        content = f"""sonar.projectKey={project_key}
 sonar.projectVersion=1.0
 sonar.sources=.
 sonar.host.url=https://sonar.thefamouscat.com
 sonar.token={sonar_token}
-"""
+sonar.analysisCache.enabled={str(analysis_cache).lower()}
+""".encode("utf-8")
 
-        # Create the file in the source directory
+        # Leave an identical file untouched so its modification time stays stable
         properties_file_path = os.path.join(directory, "sonar-project.properties")
+        try:
+            with open(properties_file_path, "rb") as f:
+                if f.read() == content:
+                    logger.info(f"sonar-project.properties file at {properties_file_path} is up to date")
+                    return
+        except OSError:
+            # Missing or unreadable, so (re)create it below
+            pass
+
+        # Create the file in the source directory
         logger.info(f"Creating sonar-project.properties file at {properties_file_path}")
 
         try:
-            with open(properties_file_path, "w") as f:
+            with open(properties_file_path, "wb") as f:
                 f.write(content)
             logger.info("sonar-project.properties file created successfully")
         except Exception as e:
@@ -99,6 +142,34 @@ sonar.token={sonar_token}
             action="store_true",
             help="Skip sonar-scanner invocation and just output the measures"
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Disable SonarQube's analysis cache and re-analyze every file, even unchanged ones"
+        )
+        parser.add_argument(
+            "--compact-json",
+            action="store_true",
+            help="Write SONAR_REPORT.json without indentation or spaces to make it smaller and faster to write"
+        )
+        parser.add_argument(
+            "--directories",
+            type=str,
+            help="Comma-separated list of directories to scan instead of --directory, each as its own project"
+        )
+        parser.add_argument(
+            "--parallel-repos",
+            type=int,
+            default=1,
+            help="Number of --directories to scan at the same time (default: 1)"
+        )
+        parser.add_argument(
+            "--cache-ttl",
+            type=int,
+            default=0,
+            help="Reuse SonarQube API responses fetched in the last CACHE_TTL seconds when --skip-scanner is used "
+                 "(default: 0, always fetch)"
+        )
         parser.add_argument(
             "--no-verify-ssl",
             action="store_true",
@@ -131,19 +202,26 @@ sonar.token={sonar_token}
             if args.show_only_repo_files_chunks:
                 # Find source files
                 if args.file:
-                    source_files = [args.file]
+                    source_files = iter([args.file])
                     logger.warning(f"Using specific file: {args.file}")
                 else:
-                    source_files = find_files(args.directory)
+                    source_files = iter_source_files(args.directory)
 
-                if not source_files:
+                # Peek at the first file to detect an empty tree without
+                # collecting the whole walk into a list first
+                first_file = next(source_files, None)
+                if first_file is None:
                     logger.error(f"No source files found in directory: {args.directory}")
                     return 1
 
                 # Display the file chunks without processing
-                self._display_file_chunks(source_files)
+                self._display_file_chunks(chain((first_file,), source_files))
                 return 0
 
+            # Scan several directories, each as its own project
+            if args.directories:
+                return self._process_directories(args)
+
             # Normal processing mode
             processed_files = self.process_files(args)  # Pass the full args namespace
 
@@ -161,104 +239,284 @@ sonar.token={sonar_token}
             logger.exception(f"An unexpected error occurred in the main run loop: {e}")
             return 1
 
-    def process_files(self, args: argparse.Namespace) -> Optional[List[str]]:
+    def _process_directories(self, args: argparse.Namespace) -> int:
+        """Run process_files for every directory in --directories.
+
+        Up to --parallel-repos directories are processed at the same time. Each scan
+        runs sonar-scanner as its own process in its own working directory, so the
+        threads only wait on I/O. Nothing is scanned if two directories share a name,
+        since they would be analyzed as the same project.
+
+        Args:
+            args: Parsed command-line arguments namespace.
+
+        Returns:
+            Exit code (0 if every directory succeeded, 1 otherwise).
+        """
+        directories = [directory.strip() for directory in args.directories.split(",") if directory.strip()]
+
+        # Each directory is scanned as the project named after it, as in process_files;
+        # two directories with the same name would overwrite each other's analysis
+        directories_by_key: Dict[str, List[str]] = {}
+        for directory in directories:
+            directories_by_key.setdefault(os.path.basename(os.path.abspath(directory)), []).append(directory)
+        duplicates = {key: dirs for key, dirs in directories_by_key.items() if len(dirs) > 1}
+        if duplicates:
+            for key, dirs in duplicates.items():
+                logger.error(f"Directories {', '.join(dirs)} would all be scanned as project '{key}'")
+            return 1
+
+        with ThreadPoolExecutor(max_workers=max(1, args.parallel_repos)) as executor:
+            futures = [executor.submit(self.process_files, args, directory) for directory in directories]
+
+        # A directory that raises counts as failed without losing the other results
+        failed = []
+        for directory, future in zip(directories, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Error processing directory {directory}: {e}", exc_info=True)
+                result = None
+            if result is None:
+                logger.error(f"Processing failed for directory: {directory}")
+                failed.append(directory)
+        logger.info(f"Successfully processed {len(directories) - len(failed)} of {len(directories)} directories.")
+
+        return 1 if failed else 0
+
+    def _categorize_files_in_chunks(self, file_paths: List[str],
+                                    categorize: Callable[..., Dict[str, str]]) -> Dict[str, str]:
+        """Categorize file paths into components, one request per chunk of paths.
+
+        One request per chunk keeps each response small. The first chunk that succeeds
+        decides the component names, and the remaining chunks are then categorized
+        concurrently into those same components, so every file shares one naming scheme.
+        A chunk that fails is logged and left out, so the categories of the other chunks
+        are kept.
+
+        Args:
+            file_paths: File paths to categorize.
+            categorize: Function that maps a list of file paths to their components,
+                optionally restricted to the component names given as components.
+
+        Returns:
+            Mapping of file path to component name for every chunk that succeeded.
+        """
+        chunks = [file_paths[i:i + CATEGORIZATION_CHUNK_SIZE]
+                  for i in range(0, len(file_paths), CATEGORIZATION_CHUNK_SIZE)]
+
+        def log_failure(chunk_number: int, error: Exception) -> None:
+            logger.error(f"OpenRouter XML-based file-to-component categorization failed for chunk "
+                         f"{chunk_number}/{len(chunks)}: {error}")
+
+        # Categorize chunks one at a time until one succeeds, to learn the component names
+        file_component_categories: Dict[str, str] = {}
+        chunk_number = 0
+        while chunk_number < len(chunks) and not file_component_categories:
+            chunk_number += 1
+            try:
+                file_component_categories.update(categorize(chunks[chunk_number - 1]))
+            except Exception as e:
+                log_failure(chunk_number, e)
+
+        remaining = list(enumerate(chunks[chunk_number:], chunk_number + 1))
+        if not remaining:
+            return file_component_categories
+
+        components = sorted(set(file_component_categories.values()))
+        with ThreadPoolExecutor(max_workers=min(CATEGORIZATION_WORKERS, len(remaining))) as categorizer:
+            futures = [(number, categorizer.submit(categorize, chunk, components=components))
+                       for number, chunk in remaining]
+
+        # The model may still drift from the given names in case; map those back
+        canonical_names = {component.casefold(): component for component in components}
+        for number, future in futures:
+            try:
+                mapping = future.result()
+            except Exception as e:
+                log_failure(number, e)
+                continue
+            for path, component in mapping.items():
+                file_component_categories[path] = canonical_names.get(component.casefold(), component)
+        return file_component_categories
+
+    def _cached_fetch(self, name: str, fetch: Callable[[str], Dict[str, Any]], host_url: str, project_key: str,
+                      cache_ttl: int, read_cache: bool) -> Dict[str, Any]:
+        """Fetch a SonarQube API response, reusing a recent copy from the disk cache.
+
+        Responses are stored under API_CACHE_DIR, keyed by host, project and request
+        name. A cached response is reused while it is younger than cache_ttl seconds.
+        Failed requests are never cached.
+
+        Args:
+            name: Name of the request, part of the cache key.
+            fetch: Client method that fetches the response for a project key.
+            host_url: SonarQube host URL, part of the cache key.
+            project_key: SonarQube project key.
+            cache_ttl: Maximum age of a reusable response in seconds; 0 disables the cache.
+            read_cache: Whether a cached response may be reused. When False, the response
+                is always fetched but still stored for later runs.
+
+        Returns:
+            JSON response from SonarQube API.
+        """
+        if cache_ttl <= 0:
+            return fetch(project_key)
+
+        cache_key = hashlib.blake2b(f"{host_url}\0{project_key}\0{name}".encode("utf-8"), digest_size=16)
+        cache_path = os.path.join(API_CACHE_DIR, f"{cache_key.hexdigest()}.json")
+
+        if read_cache:
+            try:
+                if time.time() - os.path.getmtime(cache_path) < cache_ttl:
+                    with open(cache_path, "rb") as f:
+                        response = json.load(f)
+                    logger.info(f"Using cached {name} for {project_key} from {cache_path}")
+                    return response
+            except (OSError, ValueError):
+                # Missing, unreadable or corrupt cache entries are simply fetched again
+                pass
+
+        response = fetch(project_key)
+
+        try:
+            os.makedirs(API_CACHE_DIR, exist_ok=True)
+            # Write to a temporary file first so a concurrent run never reads half a response
+            fd, temp_path = tempfile.mkstemp(dir=API_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(response, f, separators=(',', ':'))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache {name} for {project_key}: {e}")
+
+        return response
+
+    def process_files(self, args: argparse.Namespace, directory: Optional[str] = None) -> Optional[List[str]]:
         """Process files using sonar-scanner.
 
         Args:
             args: Parsed command-line arguments namespace.
+            directory: Directory to scan instead of args.directory, as one of several
+                directories scanned in the same run.
 
         Returns:
             List of files that were processed, or None on critical failure.
         """
-        directory = args.directory
+        # ORIGINAL_SRC_DIR_NAME names the single --directory, so it does not apply
+        # to directories passed in explicitly
+        use_original_name = directory is None
+        if directory is None:
+            directory = args.directory
 
         if not os.path.isdir(directory):
             logger.error(f"Directory not found: {directory}")
             return None
 
-        # Create sonar-project.properties file in the source directory
-        self._create_sonar_properties_file(directory, args)
-
         # Get the name of the original source directory from environment variables
         # If not available, fall back to the name of the current directory
-        source_dir_name = os.environ.get("ORIGINAL_SRC_DIR_NAME", os.path.basename(os.path.abspath(directory)))
+        source_dir_name = os.environ.get("ORIGINAL_SRC_DIR_NAME") if use_original_name else None
+        if source_dir_name is None:
+            source_dir_name = os.path.basename(os.path.abspath(directory))
 
         # Get project key (always use the name of the original directory)
         project_key = source_dir_name
 
-        # Check if we should skip the scanner invocation
-        skip_scanner = hasattr(args, 'skip_scanner') and args.skip_scanner
-
-        if not skip_scanner:
-            # Build sonar-scanner command
-            cmd = ["sonar-scanner"]
-
-            # Add project key (always use the name of the original directory)
-            cmd.extend([f"-Dsonar.projectKey={project_key}"])
-
-            # Add host URL if provided
-            if hasattr(args, 'host_url') and args.host_url:
-                cmd.extend([f"-Dsonar.host.url={args.host_url}"])
+        # Read the optional arguments once; callers may pass a namespace without them
+        host_url = getattr(args, 'host_url', None)
+        login = getattr(args, 'login', None)
+        sources = getattr(args, 'sources', None)
+        exclusions = getattr(args, 'exclusions', None)
 
-            # Add login token if provided
-            if hasattr(args, 'login') and args.login:
-                cmd.extend([f"-Dsonar.login={args.login}"])
+        # Get SonarQube token, used both by the scanner and for fetching the measures
+        token = login or os.environ.get("SONAR_TOKEN", "")
 
-            # Add sources if provided
-            if hasattr(args, 'sources') and args.sources:
-                cmd.extend([f"-Dsonar.sources={args.sources}"])
-            else:
-                # Default to the provided directory
-                cmd.extend([f"-Dsonar.sources={directory}"])
-
-            # Add exclusions if provided
-            if hasattr(args, 'exclusions') and args.exclusions:
-                cmd.extend([f"-Dsonar.exclusions={args.exclusions}"])
+        # Check if we should skip the scanner invocation
+        skip_scanner = getattr(args, 'skip_scanner', False)
 
-            # Run sonar-scanner
+        if not skip_scanner:
+            # Create sonar-project.properties file in the source directory; only the
+            # scanner reads it, so it is left alone when just fetching measures
+            self._create_sonar_properties_file(directory, project_key, token,
+                                               analysis_cache=not getattr(args, 'no_cache', False))
+
+            # Build sonar-scanner command: the project key (always the name of the
+            # original directory), the host URL and login token if provided, the
+            # sources (defaulting to the provided directory) and any exclusions
+            cmd = [
+                "sonar-scanner",
+                f"-Dsonar.projectKey={project_key}",
+                *([f"-Dsonar.host.url={host_url}"] if host_url else []),
+                *([f"-Dsonar.login={login}"] if login else []),
+                f"-Dsonar.sources={sources or directory}",
+                *([f"-Dsonar.exclusions={exclusions}"] if exclusions else []),
+            ]
+
+            # Run sonar-scanner; the command line and the scanner output are only
+            # logged at INFO, so when that level is off the command is not joined
+            # into a string and the regular output is not read
+            log_output = logger.isEnabledFor(logging.INFO)
             logger.info(f"Running sonar-scanner on directory: {directory}")
-            logger.info(f"Command: {' '.join(cmd)}")
+            if log_output:
+                logger.info(f"Command: {shlex.join(cmd)}")
 
             try:
-                # Change to the directory before running sonar-scanner
-                current_dir = os.getcwd()
-                os.chdir(directory)
-
-                # Run sonar-scanner
-                result = subprocess.run(cmd, check=True, text=True, capture_output=True)
-
-                # Log output
+                # Run sonar-scanner from within the directory, without changing the
+                # working directory of this process, and log its output as it arrives;
+                # stderr is merged in so error messages keep their place in the log.
+                # When INFO is disabled the regular output is discarded unread, but
+                # stderr is still collected so a failure can be reported at ERROR
                 logger.info("sonar-scanner output:")
-                for line in result.stdout.splitlines():
-                    logger.info(line)
-
-                # Change back to original directory
-                os.chdir(current_dir)
+                error_output = None
+                with subprocess.Popen(cmd, cwd=directory,
+                                      stdout=subprocess.PIPE if log_output else subprocess.DEVNULL,
+                                      stderr=subprocess.STDOUT if log_output else subprocess.PIPE,
+                                      text=True, bufsize=1) as process:
+                    if log_output:
+                        for line in process.stdout:
+                            logger.info(line.rstrip("\n"))
+                    else:
+                        _, error_output = process.communicate()
+
+                if process.returncode != 0:
+                    raise subprocess.CalledProcessError(process.returncode, cmd, stderr=error_output)
 
                 logger.info("sonar-scanner completed successfully")
+
+                # The server processes the submitted report in the background, so the
+                # measures are only up to date once that task has finished
+                ce_task_id = self._read_ce_task_id(directory)
             except subprocess.CalledProcessError as e:
                 logger.error(f"sonar-scanner failed with exit code {e.returncode}")
-                logger.error(f"Error output: {e.stderr}")
+                # With INFO enabled the error output was already logged along with the
+                # regular output; otherwise it was collected separately
+                if e.stderr:
+                    logger.error(f"Error output: {e.stderr}")
                 return None
             except Exception as e:
                 logger.error(f"Error running sonar-scanner: {e}")
                 return None
         else:
+            ce_task_id = None
             logger.info(f"Skipping sonar-scanner invocation as requested by --skip-scanner parameter")
             logger.info(f"Will attempt to fetch measures for project: {project_key}")
 
         # Get SonarQube host URL
-        host_url = args.host_url if hasattr(args, 'host_url') and args.host_url else "https://sonar.thefamouscat.com"
-
-        # Get SonarQube token
-        token = args.login if hasattr(args, 'login') and args.login else os.environ.get("SONAR_TOKEN", "")
+        host_url = host_url or "https://sonar.thefamouscat.com"
 
         # Check if SSL verification should be disabled
-        verify_ssl = not (hasattr(args, 'no_verify_ssl') and args.no_verify_ssl)
+        verify_ssl = not getattr(args, 'no_verify_ssl', False)
+
+        # Cached API responses are only reused when the scanner did not just publish a
+        # new analysis; after a scan they are refreshed instead
+        cache_ttl = getattr(args, 'cache_ttl', 0) or 0
+
+        # Imported here so that --help and --show-only-repo-files-chunks do not pay for
+        # loading the AI stack (pydantic-ai, openai, httpx) they never use
+        from ai import categorize_files_openrouter_xml
+        from sonar_scanner.client import SonarQubeClient
 
         # Fetch measures and file_measures using SonarQubeClient
         logger.info(f"Fetching measures for project: {project_key} from {host_url}")
-        client = SonarQubeClient(host_url, token, verify_ssl=verify_ssl)
 
         # Initialize variables to store API responses
         measures = None
@@ -267,55 +525,80 @@ sonar.token={sonar_token}
         security_hotspots = None
         file_component_categories = None
 
-        try:
-            # Fetch project measures
-            measures = client.fetch_measures(project_key)
-            logger.info(f"Successfully fetched project measures for {project_key}")
-        except Exception as e:
-            logger.error(f"Failed to fetch project measures: {e}")
-            measures = {"component": {"key": project_key}, "measures": []}
+        # The API requests are independent of each other, so issue them all at once
+        # and overlap their round-trips instead of waiting for each in turn; the
+        # client reuses its connections across them and closes them at the end
+        with SonarQubeClient(host_url, token, verify_ssl=verify_ssl) as client, \
+                ThreadPoolExecutor(max_workers=4) as executor:
+            if ce_task_id:
+                logger.info(f"Waiting for SonarQube to process the analysis report (task {ce_task_id})")
+                try:
+                    status = client.wait_for_task(ce_task_id)
+                    if status is None:
+                        logger.warning("Analysis report still not processed; measures may be out of date")
+                    elif status != "SUCCESS":
+                        logger.warning(f"Processing the analysis report ended with status {status}")
+                except Exception as e:
+                    logger.warning(f"Failed to wait for the analysis report to be processed: {e}")
+
+            def submit_fetch(name: str, fetch: Callable[[str], Dict[str, Any]]) -> Future:
+                return executor.submit(self._cached_fetch, name, fetch, host_url, project_key, cache_ttl, skip_scanner)
+
+            measures_future = submit_fetch("measures", client.fetch_measures)
+            file_measures_future = submit_fetch("file_measures", client.fetch_file_measures)
+            issues_future = submit_fetch("issues", client.fetch_issues)
+            security_hotspots_future = submit_fetch("security_hotspots", client.fetch_security_hotspots)
 
-        try:
-            # Fetch file measures
-            file_measures = client.fetch_file_measures(project_key)
-            logger.info(f"Successfully fetched file measures for {project_key}")
-        except Exception as e:
-            logger.error(f"Failed to fetch file measures: {e}")
-            file_measures = {"paging": {"total": 0}, "baseComponent": {"key": project_key}, "components": []}
+            try:
+                # Fetch project measures
+                measures = measures_future.result()
+                logger.info(f"Successfully fetched project measures for {project_key}")
+            except Exception as e:
+                logger.error(f"Failed to fetch project measures: {e}")
+                measures = {"component": {"key": project_key}, "measures": []}
 
-        # AI-based file-to-component categorization
-        try:
-            # Gather file paths from file_measures
-            file_paths = [comp.get('path') or comp.get('key') for comp in file_measures.get('components', []) if
-                          comp.get('path') or comp.get('key')]
-            if file_paths:
-                logger.info(
-                    f"Running OpenRouter XML-based file-to-component categorization for {len(file_paths)} file paths")
-                file_component_categories = categorize_files_openrouter_xml(file_paths)
-                logger.info(
-                    f"OpenRouter XML-based file-to-component categorization result as length: {len(file_component_categories)}")
-            else:
+            try:
+                # Fetch file measures
+                file_measures = file_measures_future.result()
+                logger.info(f"Successfully fetched file measures for {project_key}")
+            except Exception as e:
+                logger.error(f"Failed to fetch file measures: {e}")
+                file_measures = {"paging": {"total": 0}, "baseComponent": {"key": project_key}, "components": []}
+
+            # AI-based file-to-component categorization, while issues and hotspots are still loading
+            try:
+                # Gather file paths from file_measures, looking up each component's path once
+                file_paths = [path for comp in file_measures.get('components', [])
+                              if (path := comp.get('path') or comp.get('key'))]
+                if file_paths:
+                    logger.info(
+                        f"Running OpenRouter XML-based file-to-component categorization for {len(file_paths)} file paths")
+                    file_component_categories = self._categorize_files_in_chunks(
+                        file_paths, categorize_files_openrouter_xml)
+                    logger.info(
+                        f"OpenRouter XML-based file-to-component categorization result as length: {len(file_component_categories)}")
+                else:
+                    file_component_categories = {}
+                    logger.warning("No file paths found for AI categorization.")
+            except Exception as e:
+                logger.error(f"OpenRouter XML-based file-to-component categorization failed: {e}")
                 file_component_categories = {}
-                logger.warning("No file paths found for AI categorization.")
-        except Exception as e:
-            logger.error(f"OpenRouter XML-based file-to-component categorization failed: {e}")
-            file_component_categories = {}
 
-        try:
-            # Fetch issues
-            issues = client.fetch_issues(project_key)
-            logger.info(f"Successfully fetched issues for {project_key}")
-        except Exception as e:
-            logger.error(f"Failed to fetch issues: {e}")
-            issues = {"issues": [], "paging": {"total": 0}}
+            try:
+                # Fetch issues
+                issues = issues_future.result()
+                logger.info(f"Successfully fetched issues for {project_key}")
+            except Exception as e:
+                logger.error(f"Failed to fetch issues: {e}")
+                issues = {"issues": [], "paging": {"total": 0}}
 
-        try:
-            # Fetch security hotspots
-            security_hotspots = client.fetch_security_hotspots(project_key)
-            logger.info(f"Successfully fetched security hotspots for {project_key}")
-        except Exception as e:
-            logger.error(f"Failed to fetch security hotspots: {e}")
-            security_hotspots = {"hotspots": [], "paging": {"total": 0}}
+            try:
+                # Fetch security hotspots
+                security_hotspots = security_hotspots_future.result()
+                logger.info(f"Successfully fetched security hotspots for {project_key}")
+            except Exception as e:
+                logger.error(f"Failed to fetch security hotspots: {e}")
+                security_hotspots = {"hotspots": [], "paging": {"total": 0}}
 
         # Merge SONAR_MEASURES.json, SONAR_FILE_MEASURES.json, issues, and security hotspots into one report for STDOUT
         merged_sonar_report = {
@@ -328,7 +611,11 @@ sonar.token={sonar_token}
 
         report_path = os.path.join(directory, "SONAR_REPORT.json")
         with open(report_path, 'w') as f:
-            json.dump(merged_sonar_report, f, indent=2)
+            if getattr(args, 'compact_json', False):
+                # Serializing in one call uses the C encoder, which json.dump never does
+                f.write(json.dumps(merged_sonar_report, separators=(',', ':')))
+            else:
+                json.dump(merged_sonar_report, f, indent=2)
         logger.info(f"Successfully fetched, saved, and processed measures to {report_path}")
 
         return [directory]  # Return the directory as processed
@@ -3,13 +3,37 @@ SonarQube Client - A module for interacting with the SonarQube API.
 """
 
 import json
-import ssl
-import urllib.error
-import urllib.request
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from typing import Callable, Dict, Any, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from logging_utils import get_logger
 
+# Maximum number of pages of a paginated endpoint requested concurrently
+PAGE_FETCH_WORKERS = 8
+
+# Connections kept open to the SonarQube host; requests beyond this many wait for a
+# free connection instead of opening one that the pool would then discard
+CONNECTION_POOL_SIZE = 16
+
+# Seconds to wait between polls of a background task; the last delay repeats
+TASK_POLL_DELAYS = (1, 2, 4, 8, 15, 30)
+
+# Maximum number of seconds to wait for a background task to finish
+TASK_WAIT_TIMEOUT = 300
+
+# Background task statuses after which the task will not change any more
+TASK_FINAL_STATUSES = frozenset({"SUCCESS", "FAILED", "CANCELED"})
+
+# Retries for requests that fail to connect or hit a transient gateway error
+RETRY_POLICY = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+
 
 class SonarQubeClient:
     """
@@ -30,76 +54,96 @@ class SonarQubeClient:
         self.verify_ssl = verify_ssl
         self.logger = get_logger()
 
-        # Create SSL context based on verify_ssl setting
         if not self.verify_ssl:
             self.logger.warning("SSL certificate verification is disabled. This is insecure and should only be used for testing.")
-            self.ssl_context = ssl._create_unverified_context()
-        else:
-            self.ssl_context = None
 
-    def fetch_issues(self, project: str) -> Dict[str, Any]:
+        # Share one session, and so its open connections, between all API requests
+        self.session = requests.Session()
+        self.session.verify = self.verify_ssl
+        if self.token:
+            self.session.headers["Authorization"] = f"Bearer {self.token}"
+        adapter = HTTPAdapter(pool_connections=CONNECTION_POOL_SIZE, pool_maxsize=CONNECTION_POOL_SIZE,
+                              max_retries=RETRY_POLICY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Endpoints page concurrently, and several may be fetched at the same time, so
+        # cap the requests in flight across all of them at the size of the pool
+        self._request_slots = threading.BoundedSemaphore(CONNECTION_POOL_SIZE)
+
+    def close(self) -> None:
+        """
+        Close the connections held by the client.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "SonarQubeClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def wait_for_task(self, task_id: str, timeout: float = TASK_WAIT_TIMEOUT) -> Optional[str]:
+        """
+        Wait for a background (Compute Engine) task, such as processing a scanner report, to finish.
+
+        The task is polled with growing delays (TASK_POLL_DELAYS), so short tasks are
+        noticed quickly without hammering the server during long ones.
+
+        Args:
+            task_id (str): ID of the task, as reported by sonar-scanner.
+            timeout (float): Maximum number of seconds to wait. Default is TASK_WAIT_TIMEOUT.
+
+        Returns:
+            Optional[str]: Final status of the task (SUCCESS, FAILED or CANCELED), or None if it
+            did not finish within the timeout.
+
+        Raises:
+            requests.RequestException: If there's an error with the request.
+            json.JSONDecodeError: If the response is not valid JSON.
+        """
+        url = f"{self.host}/api/ce/task?id={task_id}"
+        deadline = time.monotonic() + timeout
+        delays = chain(TASK_POLL_DELAYS, repeat(TASK_POLL_DELAYS[-1]))
+
+        while True:
+            status = self._get_json(url).get('task', {}).get('status')
+            self.logger.debug(f"Background task {task_id} status: {status}")
+            if status in TASK_FINAL_STATUSES:
+                return status
+
+            delay = min(next(delays), deadline - time.monotonic())
+            if delay <= 0:
+                return None
+            time.sleep(delay)
+
+    def fetch_issues(self, project: str, max_workers: int = PAGE_FETCH_WORKERS) -> Dict[str, Any]:
         """
         Fetch issues from SonarQube API for a specific project.
 
         Args:
             project (str): Project name or key.
+            max_workers (int): Maximum number of pages fetched at the same time after the first one.
 
         Returns:
             Dict[str, Any]: JSON response from SonarQube API with all issues for the specified project.
 
         Raises:
-            urllib.error.URLError: If there's an error with the request.
+            requests.RequestException: If there's an error with the request.
             json.JSONDecodeError: If the response is not valid JSON.
         """
         # Set a reasonable page size
         page_size = 500
-        page = 1
-        all_issues = []
-        total_issues = None
-        response_data = None
-
-        # Keep fetching pages until we've got all issues
-        while total_issues is None or len(all_issues) < total_issues:
-            url = f"{self.host}/api/issues/search?componentKeys={project}&projectKeys={project}&p={page}&ps={page_size}"
-
-            self.logger.debug(f"Fetching issues page {page} from {url}")
-            request = urllib.request.Request(url)
-            if self.token:
-                request.add_header("Authorization", f"Bearer {self.token}")
-
-            try:
-                with urllib.request.urlopen(request, context=self.ssl_context) as response:
-                    response_data = json.loads(response.read().decode('utf-8'))
-
-                    # Get the total number of issues if this is the first page
-                    if total_issues is None:
-                        total_issues = response_data.get('paging', {}).get('total', 0)
-                        self.logger.info(f"Total issues to fetch: {total_issues}")
-
-                    # Add issues from this page to our collection
-                    issues = response_data.get('issues', [])
-                    all_issues.extend(issues)
-                    self.logger.info(f"Fetched {len(issues)} issues from page {page}, total so far: {len(all_issues)}/{total_issues}")
-
-                    # If this page had fewer issues than the page size, we're done
-                    if len(issues) < page_size:
-                        break
-
-                    # Move to the next page
-                    page += 1
-            except urllib.error.HTTPError as e:
-                if e.code == 401:
-                    self.logger.error("Authentication failed: Invalid or missing token. Please provide a valid SonarQube token.")
-                else:
-                    self.logger.error(f"HTTP Error {e.code}: {e.reason}")
-                raise
-            except urllib.error.URLError as e:
-                self.logger.error(f"URL Error: {e.reason}")
-                raise
-
-        # Return the original response structure but with all issues
+
+        def page_url(page: int) -> str:
+            return f"{self.host}/api/issues/search?componentKeys={project}&projectKeys={project}&p={page}&ps={page_size}"
+
+        responses = self._fetch_pages(page_url, page_size, 'issues', "issues", max_workers)
+
+        # Return the original response structure of the last page but with all issues
+        response_data = responses[-1]
         if response_data:
-            response_data['issues'] = all_issues
+            response_data['issues'] = [issue for response in responses for issue in response.get('issues', [])]
             return response_data
         else:
             # Return an empty structure if we couldn't get any data
@@ -116,7 +160,7 @@ class SonarQubeClient:
             Dict[str, Any]: JSON response from SonarQube API.
 
         Raises:
-            urllib.error.URLError: If there's an error with the request.
+            requests.RequestException: If there's an error with the request.
             json.JSONDecodeError: If the response is not valid JSON.
         """
         # Define metrics for different categories
@@ -133,103 +177,53 @@ class SonarQubeClient:
         if not self.token:
             self.logger.warning("No SonarQube token provided. Authentication may fail.")
 
-        request = urllib.request.Request(url)
-        if self.token:
-            request.add_header("Authorization", f"Bearer {self.token}")
+        return self._get_json(url)
 
-        try:
-            with urllib.request.urlopen(request, context=self.ssl_context) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except urllib.error.HTTPError as e:
-            if e.code == 401:
-                self.logger.error("Authentication failed: Invalid or missing token. Please provide a valid SonarQube token.")
-            else:
-                self.logger.error(f"HTTP Error {e.code}: {e.reason}")
-            raise
-        except urllib.error.URLError as e:
-            self.logger.error(f"URL Error: {e.reason}")
-            raise
-
-    def fetch_security_hotspots(self, project: str) -> Dict[str, Any]:
+    def fetch_security_hotspots(self, project: str, max_workers: int = PAGE_FETCH_WORKERS) -> Dict[str, Any]:
         """
         Fetch security hotspots from SonarQube API for a specific project.
 
         Args:
             project (str): Project name or key.
+            max_workers (int): Maximum number of pages fetched at the same time after the first one.
 
         Returns:
             Dict[str, Any]: JSON response from SonarQube API with all security hotspots for the specified project.
 
         Raises:
-            urllib.error.URLError: If there's an error with the request.
+            requests.RequestException: If there's an error with the request.
             json.JSONDecodeError: If the response is not valid JSON.
         """
         # Set a reasonable page size
         page_size = 500
-        page = 1
-        all_hotspots = []
-        total_hotspots = None
-        response_data = None
-
-        # Keep fetching pages until we've got all hotspots
-        while total_hotspots is None or len(all_hotspots) < total_hotspots:
-            url = f"{self.host}/api/hotspots/search?projectKey={project}&p={page}&ps={page_size}"
-
-            self.logger.debug(f"Fetching security hotspots page {page} from {url}")
-            request = urllib.request.Request(url)
-            if self.token:
-                request.add_header("Authorization", f"Bearer {self.token}")
-
-            try:
-                with urllib.request.urlopen(request, context=self.ssl_context) as response:
-                    response_data = json.loads(response.read().decode('utf-8'))
-
-                    # Get the total number of hotspots if this is the first page
-                    if total_hotspots is None:
-                        total_hotspots = response_data.get('paging', {}).get('total', 0)
-                        self.logger.info(f"Total security hotspots to fetch: {total_hotspots}")
-
-                    # Add hotspots from this page to our collection
-                    hotspots = response_data.get('hotspots', [])
-                    all_hotspots.extend(hotspots)
-                    self.logger.info(f"Fetched {len(hotspots)} security hotspots from page {page}, total so far: {len(all_hotspots)}/{total_hotspots}")
-
-                    # If this page had fewer hotspots than the page size, we're done
-                    if len(hotspots) < page_size:
-                        break
-
-                    # Move to the next page
-                    page += 1
-            except urllib.error.HTTPError as e:
-                if e.code == 401:
-                    self.logger.error("Authentication failed: Invalid or missing token. Please provide a valid SonarQube token.")
-                else:
-                    self.logger.error(f"HTTP Error {e.code}: {e.reason}")
-                raise
-            except urllib.error.URLError as e:
-                self.logger.error(f"URL Error: {e.reason}")
-                raise
-
-        # Return the original response structure but with all hotspots
+
+        def page_url(page: int) -> str:
+            return f"{self.host}/api/hotspots/search?projectKey={project}&p={page}&ps={page_size}"
+
+        responses = self._fetch_pages(page_url, page_size, 'hotspots', "security hotspots", max_workers)
+
+        # Return the original response structure of the last page but with all hotspots
+        response_data = responses[-1]
         if response_data:
-            response_data['hotspots'] = all_hotspots
+            response_data['hotspots'] = [hotspot for response in responses for hotspot in response.get('hotspots', [])]
             return response_data
         else:
             # Return an empty structure if we couldn't get any data
             return {"hotspots": [], "paging": {"total": 0}}
 
-    def fetch_file_measures(self, project: str) -> Dict[str, Any]:
+    def fetch_file_measures(self, project: str, max_workers: int = PAGE_FETCH_WORKERS) -> Dict[str, Any]:
         """
         Fetch all measures for all files in a project from SonarQube API.
 
         Args:
             project (str): Project name or key.
+            max_workers (int): Maximum number of pages fetched at the same time after the first one.
 
         Returns:
             Dict[str, Any]: JSON response from SonarQube API with all file measures.
 
         Raises:
-            urllib.error.URLError: If there's an error with the request.
+            requests.RequestException: If there's an error with the request.
             json.JSONDecodeError: If the response is not valid JSON.
         """
         # Define metrics for different categories
@@ -243,54 +237,16 @@ class SonarQubeClient:
 
         # Set a reasonable page size
         page_size = 500
-        page = 1
-        all_components = []
-        total_components = None
-        base_component = None
 
-        # Keep fetching pages until we've got all components
-        while total_components is None or len(all_components) < total_components:
+        def page_url(page: int) -> str:
             # Use component_tree endpoint to get metrics for all files
-            url = f"{self.host}/api/measures/component_tree?component={project}&metricKeys={all_metrics}&qualifiers=FIL&p={page}&ps={page_size}"
-
-            self.logger.debug(f"Fetching file measures page {page} from {url}")
-            request = urllib.request.Request(url)
-            if self.token:
-                request.add_header("Authorization", f"Bearer {self.token}")
-
-            try:
-                with urllib.request.urlopen(request, context=self.ssl_context) as response:
-                    response_data = json.loads(response.read().decode('utf-8'))
-
-                    # Save the base component from the first page
-                    if base_component is None:
-                        base_component = response_data.get('baseComponent', {})
-
-                    # Get the total number of components if this is the first page
-                    if total_components is None:
-                        total_components = response_data.get('paging', {}).get('total', 0)
-                        self.logger.info(f"Total file components to fetch: {total_components}")
-
-                    # Add components from this page to our collection
-                    components = response_data.get('components', [])
-                    all_components.extend(components)
-                    self.logger.info(f"Fetched {len(components)} file components from page {page}, total so far: {len(all_components)}/{total_components}")
-
-                    # If this page had fewer components than the page size, we're done
-                    if len(components) < page_size:
-                        break
-
-                    # Move to the next page
-                    page += 1
-            except urllib.error.HTTPError as e:
-                if e.code == 401:
-                    self.logger.error("Authentication failed: Invalid or missing token. Please provide a valid SonarQube token.")
-                else:
-                    self.logger.error(f"HTTP Error {e.code}: {e.reason}")
-                raise
-            except urllib.error.URLError as e:
-                self.logger.error(f"URL Error: {e.reason}")
-                raise
+            return (f"{self.host}/api/measures/component_tree?component={project}&metricKeys={all_metrics}"
+                    f"&qualifiers=FIL&p={page}&ps={page_size}")
+
+        responses = self._fetch_pages(page_url, page_size, 'components', "file components", max_workers)
+        base_component = responses[0].get('baseComponent', {})
+        total_components = responses[0].get('paging', {}).get('total', 0)
+        all_components = [component for response in responses for component in response.get('components', [])]
 
         # Return the original response structure but with all components
         return {
@@ -302,3 +258,82 @@ class SonarQubeClient:
             "baseComponent": base_component,
             "components": all_components
         }
+
+    def _fetch_pages(self, page_url: Callable[[int], str], page_size: int, items_key: str, description: str,
+                     max_workers: int) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a paginated SonarQube API endpoint.
+
+        The first page tells how many items, and therefore pages, there are. The
+        remaining pages are independent of each other, so they are fetched
+        concurrently instead of one round-trip after the other.
+
+        Args:
+            page_url (Callable[[int], str]): Builds the URL of a page from its 1-based number.
+            page_size (int): Number of items requested per page.
+            items_key (str): Key of the list of items in each response.
+            description (str): Name of the items, used in log messages.
+            max_workers (int): Maximum number of pages fetched at the same time after the first one.
+
+        Returns:
+            List[Dict[str, Any]]: JSON responses in page order, up to and including the first page that is not full.
+
+        Raises:
+            requests.RequestException: If there's an error with the request.
+            json.JSONDecodeError: If the response is not valid JSON.
+        """
+        def fetch_page(page: int) -> Dict[str, Any]:
+            self.logger.debug(f"Fetching {description} page {page} from {page_url(page)}")
+            return self._get_json(page_url(page))
+
+        responses = [fetch_page(1)]
+        total_items = responses[0].get('paging', {}).get('total', 0)
+        self.logger.info(f"Total {description} to fetch: {total_items}")
+
+        page_count = -(-total_items // page_size)
+        if page_count > 1 and len(responses[0].get(items_key, [])) == page_size:
+            # map keeps the pages in page order
+            with ThreadPoolExecutor(max_workers=min(max_workers, page_count - 1)) as executor:
+                responses.extend(executor.map(fetch_page, range(2, page_count + 1)))
+
+        fetched_items = 0
+        for page, response in enumerate(responses, 1):
+            items = response.get(items_key, [])
+            fetched_items += len(items)
+            self.logger.info(f"Fetched {len(items)} {description} from page {page}, total so far: {fetched_items}/{total_items}")
+
+            # If this page had fewer items than the page size, we're done
+            if len(items) < page_size:
+                return responses[:page]
+
+        return responses
+
+    def _get_json(self, url: str) -> Dict[str, Any]:
+        """
+        Send an authenticated GET request to the SonarQube API and decode the response.
+
+        Args:
+            url (str): Full URL of the API endpoint, including query parameters.
+
+        Returns:
+            Dict[str, Any]: JSON response from SonarQube API.
+
+        Raises:
+            requests.RequestException: If there's an error with the request.
+            json.JSONDecodeError: If the response is not valid JSON.
+        """
+        try:
+            with self._request_slots:
+                response = self.session.get(url)
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            if e.response.status_code == 401:
+                self.logger.error("Authentication failed: Invalid or missing token. Please provide a valid SonarQube token.")
+            else:
+                self.logger.error(f"HTTP Error {e.response.status_code}: {e.response.reason}")
+            raise
+        except requests.RequestException as e:
+            self.logger.error(f"Request Error: {e}")
+            raise
+
+        return json.loads(response.content)
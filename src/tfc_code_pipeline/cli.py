@@ -10,12 +10,12 @@ import sys
 from typing import Optional, Sequence, Dict
 
 from code_processor import CodeProcessor  # Import base class
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 # Local application imports
 from .main import main
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
 
 # Map command names to processor module and class names
 PROCESSOR_MAP: Dict[str, Dict[str, str]] = {
@@ -9,9 +9,9 @@ from pathlib import Path
 from typing import List, Optional, Sequence
 
 from code_processor import CodeProcessor
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
-logger = get_logger("tfc-code-pipeline.fix_bugs")
+logger = LazyLogger("tfc-code-pipeline.fix_bugs")
 
 
 class FixBugsProcessor(CodeProcessor):
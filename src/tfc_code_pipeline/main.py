@@ -10,10 +10,10 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Union, Sequence
 
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
 
 # Third-party imports
 from dotenv import load_dotenv
@@ -12,10 +12,10 @@ from typing import Dict, Any, Optional, Tuple
 import jsonschema
 import requests
 
-from logging_utils import get_logger
+from logging_utils import LazyLogger
 
 # Set up logging
-logger = get_logger()
+logger = LazyLogger()
 
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
@@ -5,19 +5,25 @@ in a directory while excluding dependencies, tests, and other non-core files.
 """
 
 import os
+import random
+import subprocess
 import sys
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from tempfile import TemporaryDirectory
-from argparse import Namespace
+from argparse import ArgumentTypeError, Namespace
 from io import StringIO
 
 # Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'src'))
+SRC_DIR = Path(__file__).resolve().parent.parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
 
 # Import the module to test
+import find_source_files as find_source_files_module
 from find_source_files import (
+    existing_directory,
     parse_args,
     is_source_file,
     is_config_file,
@@ -25,6 +31,7 @@ from find_source_files import (
     is_dot_file,
     should_skip_directory,
     find_source_files,
+    iter_source_files,
     main
 )
 
@@ -40,6 +47,44 @@ class TestFindSourceFiles(unittest.TestCase):
                 args = parse_args()
                 self.assertEqual(args.directory, "/path/to/dir")
 
+    def test_parse_args_rejects_missing_directory(self):
+        """Test parse_args exits with a usage error for a nonexistent directory."""
+        with patch('sys.argv', ['find_source_files.py', '--directory', '/nonexistent/directory']):
+            with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
+                with self.assertRaises(SystemExit) as cm:
+                    parse_args()
+
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("/nonexistent/directory", mock_stderr.getvalue())
+
+    def test_main_rejects_missing_directory_before_configuring_logging(self):
+        """Test importing the module and exiting on a nonexistent directory never loads the logging config."""
+        script = (
+            "import sys\n"
+            "import logging_utils\n"
+            "from find_source_files import main\n"
+            "sys.argv = ['find_source_files.py', '--directory', '/nonexistent/directory']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit as e:\n"
+            "    print(e.code, logging_utils.isInitialized)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env)
+
+        self.assertEqual(result.stdout.split(), ["2", "False"])
+        self.assertIn("/nonexistent/directory", result.stderr)
+
+    def test_existing_directory(self):
+        """Test existing_directory accepts directories and rejects everything else."""
+        with TemporaryDirectory() as temp_dir:
+            self.assertEqual(existing_directory(temp_dir), temp_dir)
+
+            file_path = Path(temp_dir) / "file.txt"
+            file_path.touch()
+            with self.assertRaises(ArgumentTypeError):
+                existing_directory(str(file_path))
+
     def test_is_config_file(self):
         """Test is_config_file with various file names."""
         # Test common configuration files
@@ -197,12 +242,12 @@ class TestFindSourceFiles(unittest.TestCase):
         self.assertFalse(should_skip_directory(Path("lib")))
         self.assertFalse(should_skip_directory(Path("core")))
 
-        # Test nested directories
-        self.assertTrue(should_skip_directory(Path("/path/to/node_modules/subdir")))
-        self.assertTrue(should_skip_directory(Path("/path/to/tests/subdir")))
-        self.assertTrue(should_skip_directory(Path("/path/to/.hidden_dir/subdir")))
-        self.assertTrue(should_skip_directory(Path("/path/to/.git/subdir")))
+        # Test nested directories (only the directory's own name matters)
+        self.assertTrue(should_skip_directory(Path("/path/to/src/node_modules")))
+        self.assertTrue(should_skip_directory(Path("/path/to/src/.hidden_dir")))
+        self.assertTrue(should_skip_directory("/path/to/src/tests"))
         self.assertFalse(should_skip_directory(Path("/path/to/src/subdir")))
+        self.assertFalse(should_skip_directory(Path("/tmp/project/src")))
 
     def test_find_source_files_empty_directory(self):
         """Test find_source_files with an empty directory."""
@@ -352,6 +397,21 @@ class TestFindSourceFiles(unittest.TestCase):
                 full_path = str(Path(temp_dir) / file_path)
                 self.assertNotIn(full_path, found_files)
 
+    def test_find_source_files_does_not_follow_symlinks(self):
+        """Test find_source_files ignores symlinked files and directories."""
+        with TemporaryDirectory() as temp_dir, TemporaryDirectory() as other_dir:
+            (Path(other_dir) / "linked.py").touch()
+            (Path(temp_dir) / "src").mkdir()
+            (Path(temp_dir) / "src" / "file1.py").touch()
+            (Path(temp_dir) / "src" / "alias.py").symlink_to(Path(temp_dir) / "src" / "file1.py")
+            (Path(temp_dir) / "external").symlink_to(other_dir, target_is_directory=True)
+            # A link back to the root would loop forever if it were followed
+            (Path(temp_dir) / "src" / "loop").symlink_to(temp_dir, target_is_directory=True)
+
+            found_files = find_source_files(temp_dir)
+
+            self.assertEqual(found_files, [str(Path(temp_dir) / "src" / "file1.py")])
+
     def test_find_source_files_nonexistent_directory(self):
         """Test find_source_files with a nonexistent directory."""
         with patch('sys.stderr', new=MagicMock()):
@@ -370,34 +430,77 @@ class TestFindSourceFiles(unittest.TestCase):
                 source_files = find_source_files(str(file_path))
                 self.assertEqual(source_files, [])
 
+    def test_iter_source_files(self):
+        """Test iter_source_files yields the same files as find_source_files."""
+        with TemporaryDirectory() as temp_dir:
+            for file_path in ["file1.py", "lib/file2.js", "lib/core/file3.go", "notes.txt"]:
+                full_path = Path(temp_dir) / file_path
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                full_path.touch()
+
+            found_files = list(iter_source_files(temp_dir))
+
+            self.assertEqual(len(found_files), 3)
+            self.assertEqual(sorted(found_files), sorted(find_source_files(temp_dir)))
+
+    def test_find_source_files_order_is_stable(self):
+        """Test find_source_files returns the same order however the parallel scans finish."""
+        with TemporaryDirectory() as temp_dir:
+            # Wide enough at two levels for subtrees to be scanned in parallel
+            for package in range(8):
+                for module in range(8):
+                    full_path = Path(temp_dir) / f"pkg{package}" / f"mod{module}" / "code.py"
+                    full_path.parent.mkdir(parents=True, exist_ok=True)
+                    full_path.touch()
+                (Path(temp_dir) / f"pkg{package}" / "init.py").touch()
+
+            scan_directory = find_source_files_module._scan_directory
+            delays = random.Random(42)
+
+            def slow_scan_directory(directory):
+                # Let the subtrees finish in a different order on every run
+                time.sleep(delays.random() / 500)
+                return scan_directory(directory)
+
+            orders = []
+            for _ in range(3):
+                with patch('find_source_files._scan_directory', side_effect=slow_scan_directory):
+                    orders.append(find_source_files(temp_dir))
+
+            self.assertEqual(len(orders[0]), 72)
+            self.assertEqual(orders[1], orders[0])
+            self.assertEqual(orders[2], orders[0])
+
     @patch('argparse.ArgumentParser.parse_args')
-    @patch('find_source_files.find_source_files')
-    def test_main_success(self, mock_find_source_files, mock_parse_args):
+    @patch('find_source_files.iter_source_files')
+    def test_main_success(self, mock_iter_source_files, mock_parse_args):
         """Test main function with successful execution."""
         # Setup mocks
         mock_parse_args.return_value = Namespace(directory="/path/to/dir", verbose=False)
-        mock_find_source_files.return_value = ["/path/to/dir/file1.py", "/path/to/dir/file2.js"]
+        mock_iter_source_files.return_value = iter(["/path/to/dir/file1.py", "/path/to/dir/file2.js"])
 
-        # Capture logger output
-        with self.assertLogs('tfc-code-pipeline', level='INFO') as cm:
+        # Capture stdout
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
             result = main()
 
-            # Verify the result
-            self.assertEqual(result, 0)
-            mock_parse_args.assert_called_once()
-            mock_find_source_files.assert_called_once_with("/path/to/dir")
+        # Verify the result
+        self.assertEqual(result, 0)
+        mock_parse_args.assert_called_once()
+        mock_iter_source_files.assert_called_once_with("/path/to/dir")
 
-            # Verify that the log messages contain the file paths
-            self.assertTrue(any("/path/to/dir/file1.py" in msg for msg in cm.output))
-            self.assertTrue(any("/path/to/dir/file2.js" in msg for msg in cm.output))
+        # Verify that each file path is printed on its own line
+        self.assertEqual(
+            mock_stdout.getvalue().splitlines(),
+            ["/path/to/dir/file1.py", "/path/to/dir/file2.js"]
+        )
 
     @patch('argparse.ArgumentParser.parse_args')
-    @patch('find_source_files.find_source_files')
-    def test_main_exception(self, mock_find_source_files, mock_parse_args):
+    @patch('find_source_files.iter_source_files')
+    def test_main_exception(self, mock_iter_source_files, mock_parse_args):
         """Test main function with an exception."""
-        # Setup mocks to raise an exception during find_source_files call
+        # Setup mocks to raise an exception during iter_source_files call
         mock_parse_args.return_value = Namespace(directory="/path/to/dir", verbose=False)
-        mock_find_source_files.side_effect = Exception("Test exception")
+        mock_iter_source_files.side_effect = Exception("Test exception")
 
         # Capture logger output
         with self.assertLogs('tfc-code-pipeline', level='ERROR') as cm:
@@ -406,7 +509,7 @@ class TestFindSourceFiles(unittest.TestCase):
             # Verify the result
             self.assertEqual(result, 1)
             mock_parse_args.assert_called_once()
-            mock_find_source_files.assert_called_once_with("/path/to/dir")
+            mock_iter_source_files.assert_called_once_with("/path/to/dir")
 
             # Check that the error message was logged
             self.assertTrue(any("Error: Test exception" in msg for msg in cm.output))
@@ -0,0 +1,194 @@
+"""Tests for the sonar_analyzer module.
+
+This module contains tests for the SonarAnalyzerProcessor, which turns a Sonar scanner
+report into improvement suggestions and AI prompts for each component.
+"""
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+from sonar_analyzer import (
+    IMPROVEMENT_AREAS,
+    PARALLEL_COMPONENT_THRESHOLD,
+    SECURITY_AREA,
+    SEVERITY_RANKS,
+    SonarAnalyzerProcessor,
+    _categorize_rule,
+)
+
+RULES = [
+    ("python:S3776", "Refactor this function to reduce its Cognitive Complexity"),
+    ("python:S1192", "Define a constant instead of duplicating this literal"),
+    ("python:S1172", "Remove the unused function parameter"),
+    ("python:S112", "Replace this generic exception class"),
+    ("python:S5754", "Specify an exception class to catch"),
+]
+
+SEVERITIES = ["INFO", "LOW", "MEDIUM", "HIGH", "BLOCKER"]
+
+
+def make_report(component_count):
+    """Build a report with issues spread over component_count components.
+
+    Args:
+        component_count: Number of components with issues.
+
+    Returns:
+        The report data, with one complex file without issues in its file measures.
+    """
+    issues = []
+    for index in range(component_count):
+        for offset in range(index % 4 + 1):
+            rule, message = RULES[(index + offset) % len(RULES)]
+            issues.append({
+                "component": f"project:src/module{index}.py",
+                "rule": rule,
+                "severity": SEVERITIES[(index + offset) % len(SEVERITIES)],
+                "message": message,
+                "line": offset + 1,
+            })
+
+    components = [
+        {"key": "project:src/module0.py", "measures": [{"metric": "complexity", "value": "45"}]},
+        {"key": "project:src/complex.py", "measures": [
+            {"metric": "complexity", "value": "80"},
+            {"metric": "cognitive_complexity", "value": "60"},
+            {"metric": "ncloc", "value": "900"},
+            {"metric": "functions", "value": "4"},
+        ]},
+        {"key": "project:src/simple.py", "measures": [{"metric": "complexity", "value": "3"}]},
+    ]
+
+    return {"issues": {"issues": issues}, "file_measures": {"components": components}}
+
+
+def area_of(suggestion):
+    """Find the index of the improvement area with the given suggestion."""
+    return next(area for area, (_, _, text) in enumerate(IMPROVEMENT_AREAS) if text == suggestion)
+
+
+class TestCategorizeRule(unittest.TestCase):
+    """Tests for mapping a rule to its improvement area."""
+
+    def test_complexity_rule_code(self):
+        """Test S3776 is a complexity rule whatever its message."""
+        self.assertEqual(_categorize_rule("S3776", "Refactor this function"),
+                         area_of("Improve code maintainability by reducing complexity"))
+
+    def test_s1_rule_code_is_security(self):
+        """Test an S1 rule without a more specific match falls into the security area."""
+        self.assertEqual(_categorize_rule("S1481", "Remove this local variable"), SECURITY_AREA)
+        self.assertEqual(IMPROVEMENT_AREAS[SECURITY_AREA][2], "Strengthen security posture")
+
+    def test_listed_s1_rule_codes_are_security_not_bugs(self):
+        """Test S112 and S1313 are security rules, as the S1 prefix ranks above bugs."""
+        self.assertEqual(_categorize_rule("S112", "Raise a more specific error"), SECURITY_AREA)
+        self.assertEqual(_categorize_rule("S1313", "Make sure this IP address is safe"), SECURITY_AREA)
+
+    def test_rule_code_of_a_lower_area(self):
+        """Test a listed rule code outside the S1 prefix maps to its own area."""
+        self.assertEqual(_categorize_rule("S1871", "Merge these branches"),
+                         area_of("Enhance code structure by eliminating duplications"))
+        self.assertEqual(_categorize_rule("S2201", "Handle this Exception"),
+                         area_of("Improve code reliability"))
+
+    def test_keyword_of_higher_area_beats_rule_code(self):
+        """Test a message keyword of a higher-priority area wins over the rule code's area."""
+        self.assertEqual(_categorize_rule("S1172", "This has a high Cognitive Complexity"),
+                         area_of("Improve code maintainability by reducing complexity"))
+        self.assertEqual(_categorize_rule("S1481", "Remove this unused variable"),
+                         area_of("Clean up codebase by removing unused elements"))
+
+    def test_keyword_of_lower_area_does_not_beat_rule_code(self):
+        """Test a message keyword of a lower-priority area does not override the rule code."""
+        self.assertEqual(_categorize_rule("S3776", "Add a test for this"),
+                         area_of("Improve code maintainability by reducing complexity"))
+
+    def test_keyword_only(self):
+        """Test an unlisted rule code is categorized by its message."""
+        self.assertEqual(_categorize_rule("S7000", "Rename this variable to match the naming convention"),
+                         area_of("Improve code readability"))
+        self.assertEqual(_categorize_rule("S7000", "Fix the INDENT of this line"),
+                         area_of("Standardize code formatting"))
+
+    def test_no_match(self):
+        """Test a rule matching no rule code or keyword has no area."""
+        self.assertIsNone(_categorize_rule("S7000", "Use a list literal"))
+        self.assertIsNone(_categorize_rule("", ""))
+
+
+class TestAnalyzeReport(unittest.TestCase):
+    """Tests for SonarAnalyzerProcessor._analyze_report."""
+
+    def setUp(self):
+        """Create a processor."""
+        self.processor = SonarAnalyzerProcessor()
+
+    def test_parallel_matches_sequential(self):
+        """Test worker processes generate exactly the sequential suggestions."""
+        component_count = PARALLEL_COMPONENT_THRESHOLD + 50
+
+        sequential = self.processor._analyze_report(make_report(component_count), SEVERITY_RANKS["LOW"])
+        with patch("sonar_analyzer.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as mock_executor:
+            parallel = self.processor._analyze_report(make_report(component_count), SEVERITY_RANKS["LOW"],
+                                                      parallel=True)
+        mock_executor.assert_called_once()
+
+        self.assertGreater(len(sequential), PARALLEL_COMPONENT_THRESHOLD)
+        self.assertEqual(list(parallel), list(sequential))
+        self.assertEqual(parallel, sequential)
+
+    def test_skip_complexity(self):
+        """Test skip_complexity leaves out complexity-only components and data."""
+        with_complexity = self.processor._analyze_report(make_report(3), SEVERITY_RANKS["INFO"])
+        without_complexity = self.processor._analyze_report(make_report(3), SEVERITY_RANKS["INFO"],
+                                                            skip_complexity=True)
+
+        self.assertIn("project:src/complex.py", with_complexity)
+        self.assertIn("complexity_data", with_complexity["project:src/module0.py"])
+
+        self.assertNotIn("project:src/complex.py", without_complexity)
+        self.assertNotIn("complexity_data", without_complexity["project:src/module0.py"])
+        self.assertEqual(set(without_complexity), set(with_complexity) - {"project:src/complex.py"})
+
+    def test_null_component(self):
+        """Test issues with a null component are grouped under the empty key."""
+        report = {"issues": {"issues": [
+            {"component": None, "rule": "python:S3776", "severity": "HIGH",
+             "message": "Refactor this function to reduce its Cognitive Complexity"},
+            {"component": "project:src/main.py", "rule": "python:S1192", "severity": "HIGH",
+             "message": "Define a constant instead of duplicating this literal", "line": 3},
+            {"component": "project:src/main.py", "rule": "python:S1192", "severity": "HIGH",
+             "message": "Define a constant instead of duplicating this literal", "line": 7},
+        ]}}
+
+        suggestions = self.processor._analyze_report(report, SEVERITY_RANKS["LOW"])
+
+        self.assertEqual(set(suggestions), {"", "project:src/main.py"})
+        self.assertEqual(suggestions[""]["issues_count"], 1)
+
+
+class TestAnalyzeFileComplexity(unittest.TestCase):
+    """Tests for SonarAnalyzerProcessor._analyze_file_complexity."""
+
+    def analyze(self, value):
+        """Analyze one file whose complexity measure has the given value."""
+        components = [{"key": "project:src/file.py", "measures": [
+            {"metric": "complexity", "value": value},
+            {"metric": "ncloc", "value": "600"},
+        ]}]
+        return SonarAnalyzerProcessor()._analyze_file_complexity(components)["project:src/file.py"]
+
+    def test_digit_value(self):
+        """Test a plain digit string is parsed."""
+        self.assertEqual(self.analyze("45")["complexity"], 45)
+
+    def test_non_digit_values_count_as_zero(self):
+        """Test values with signs, spaces, underscores or decimals count as 0."""
+        for value in (" 5", "+5", "1_000", "-3", "4.5", ""):
+            with self.subTest(value=value):
+                self.assertEqual(self.analyze(value)["complexity"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
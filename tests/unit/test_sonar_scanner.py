@@ -0,0 +1,338 @@
+"""Tests for the sonar_scanner module.
+
+This module contains tests for the SonarScannerProcessor, which runs sonar-scanner on a
+codebase and collects the resulting measures, issues and hotspots from SonarQube.
+"""
+
+import os
+import stat
+import time
+import unittest
+from argparse import Namespace
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+from logging_utils import get_logger
+from sonar_scanner import CATEGORIZATION_CHUNK_SIZE, SonarScannerProcessor
+
+
+class TestRunScanner(unittest.TestCase):
+    """Tests for running sonar-scanner from process_files."""
+
+    def setUp(self):
+        """Put a fake sonar-scanner that fails on stderr in front of the PATH."""
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        bin_dir = os.path.join(self.temp_dir.name, "bin")
+        os.mkdir(bin_dir)
+        scanner_path = os.path.join(bin_dir, "sonar-scanner")
+        with open(scanner_path, "w") as f:
+            f.write("#!/bin/sh\necho 'INFO: Scanning'\necho 'ERROR: Not authorized' >&2\nexit 3\n")
+        os.chmod(scanner_path, os.stat(scanner_path).st_mode | stat.S_IEXEC)
+
+        self.project_dir = os.path.join(self.temp_dir.name, "project")
+        os.mkdir(self.project_dir)
+        path_patcher = patch.dict(os.environ, {"PATH": bin_dir + os.pathsep + os.environ.get("PATH", "")})
+        path_patcher.start()
+        self.addCleanup(path_patcher.stop)
+
+    def test_failing_scanner_logs_error_output_with_info_disabled(self):
+        """Test that the scanner's error output is still logged when INFO is off."""
+        processor = SonarScannerProcessor(["--directory", self.project_dir])
+
+        # assertLogs at ERROR also raises the logger level, disabling INFO
+        with self.assertLogs(get_logger(), level="ERROR") as logs:
+            result = processor.process_files(processor.args)
+
+        self.assertIsNone(result)
+        output = "\n".join(logs.output)
+        self.assertIn("sonar-scanner failed with exit code 3", output)
+        self.assertIn("ERROR: Not authorized", output)
+        self.assertNotIn("INFO: Scanning", output)
+
+    def test_failing_scanner_logs_error_output_with_info_enabled(self):
+        """Test that the scanner's error output is logged with the regular output."""
+        processor = SonarScannerProcessor(["--directory", self.project_dir])
+
+        with self.assertLogs(get_logger(), level="INFO") as logs:
+            result = processor.process_files(processor.args)
+
+        self.assertIsNone(result)
+        output = "\n".join(logs.output)
+        self.assertIn("INFO: Scanning", output)
+        self.assertIn("ERROR: Not authorized", output)
+        self.assertIn("sonar-scanner failed with exit code 3", output)
+
+
+class TestProcessDirectories(unittest.TestCase):
+    """Tests for scanning several directories with --directories."""
+
+    def run_directories(self, directories, results=None, parallel_repos=2):
+        """Run _process_directories with process_files stubbed.
+
+        Args:
+            directories: Value of --directories.
+            results: Mapping of directory to the result process_files returns for it, or to
+                an exception it raises; by default every directory succeeds.
+            parallel_repos: Value of --parallel-repos.
+
+        Returns:
+            Tuple of the exit code and the mocked process_files.
+        """
+        results = results or {}
+        args = Namespace(directories=directories, parallel_repos=parallel_repos)
+        processor = SonarScannerProcessor(args)
+
+        def process_files(_, directory):
+            result = results.get(directory, [directory])
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch.object(processor, "process_files", side_effect=process_files) as mock_process_files:
+            exit_code = processor._process_directories(args)
+        return exit_code, mock_process_files
+
+    def test_all_directories_succeed(self):
+        """Test every listed directory is processed as its own project."""
+        exit_code, mock_process_files = self.run_directories("repos/app, repos/lib,")
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(sorted(c.args[1] for c in mock_process_files.call_args_list), ["repos/app", "repos/lib"])
+
+    def test_failed_directory(self):
+        """Test one failing directory makes the run fail while the others still run."""
+        exit_code, mock_process_files = self.run_directories("repos/app,repos/lib", {"repos/app": None})
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(mock_process_files.call_count, 2)
+
+    def test_directory_raises(self):
+        """Test a directory whose processing raises is counted as failed and the others are kept."""
+        with self.assertLogs(get_logger(), level="INFO") as logs:
+            exit_code, mock_process_files = self.run_directories(
+                "repos/app,repos/lib,repos/web", {"repos/lib": RuntimeError("scanner crashed")})
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(mock_process_files.call_count, 3)
+        self.assertTrue(any("repos/lib: scanner crashed" in line for line in logs.output))
+        self.assertIn("Processing failed for directory: repos/lib", "\n".join(logs.output))
+        self.assertIn("Successfully processed 2 of 3 directories.", logs.output[-1])
+
+    def test_duplicate_project_keys(self):
+        """Test directories that would share a project key are rejected before scanning."""
+        with self.assertLogs(get_logger(), level="ERROR") as logs:
+            exit_code, mock_process_files = self.run_directories("a/app,b/app,c/lib")
+
+        self.assertEqual(exit_code, 1)
+        mock_process_files.assert_not_called()
+        self.assertIn("a/app, b/app", logs.output[0])
+        self.assertIn("'app'", logs.output[0])
+
+
+class TestCategorizeFilesInChunks(unittest.TestCase):
+    """Tests for categorizing file paths into components in chunks."""
+
+    def test_merges_all_chunks(self):
+        """Test every chunk is categorized and the mappings are merged."""
+        file_paths = [f"src/file{i}.py" for i in range(CATEGORIZATION_CHUNK_SIZE * 2 + 10)]
+        categorize = MagicMock(side_effect=lambda paths, components=None: {path: "Core Functionality"
+                                                                           for path in paths})
+
+        categories = SonarScannerProcessor()._categorize_files_in_chunks(file_paths, categorize)
+
+        self.assertEqual(categories, {path: "Core Functionality" for path in file_paths})
+        self.assertEqual(sorted(len(c.args[0]) for c in categorize.call_args_list),
+                         [10, CATEGORIZATION_CHUNK_SIZE, CATEGORIZATION_CHUNK_SIZE])
+
+    def test_chunks_share_component_names(self):
+        """Test later chunks reuse the component names chosen for the first chunk."""
+        file_paths = [f"src/api/file{i}.py" for i in range(CATEGORIZATION_CHUNK_SIZE * 3)]
+        calls = []
+
+        def categorize(paths, components=None):
+            # Like the model, invent a new name on every call unless given a list to use
+            calls.append(components)
+            if components:
+                return {path: components[0].upper() for path in paths}
+            return {path: f"API {len(calls)}" for path in paths}
+
+        categories = SonarScannerProcessor()._categorize_files_in_chunks(file_paths, categorize)
+
+        self.assertEqual(set(categories.values()), {"API 1"})
+        self.assertEqual(len(categories), len(file_paths))
+        self.assertEqual(calls, [None, ["API 1"], ["API 1"]])
+
+    def test_failed_chunk_keeps_the_others(self):
+        """Test a failing chunk is logged while the categories of the other chunks are kept."""
+        file_paths = [f"src/file{i}.py" for i in range(CATEGORIZATION_CHUNK_SIZE * 3)]
+        failing_paths = file_paths[CATEGORIZATION_CHUNK_SIZE:CATEGORIZATION_CHUNK_SIZE * 2]
+
+        def categorize(paths, components=None):
+            if paths == failing_paths:
+                raise RuntimeError("OpenRouter returned 502")
+            return {path: "Utilities" for path in paths}
+
+        with self.assertLogs(get_logger(), level="ERROR") as logs:
+            categories = SonarScannerProcessor()._categorize_files_in_chunks(file_paths, categorize)
+
+        self.assertEqual(set(categories), set(file_paths) - set(failing_paths))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("chunk 2/3", logs.output[0])
+        self.assertIn("OpenRouter returned 502", logs.output[0])
+
+    def test_failed_first_chunk(self):
+        """Test the component names come from the next chunk when the first one fails."""
+        file_paths = [f"src/file{i}.py" for i in range(CATEGORIZATION_CHUNK_SIZE * 3)]
+        calls = []
+
+        def categorize(paths, components=None):
+            calls.append(components)
+            if paths == file_paths[:CATEGORIZATION_CHUNK_SIZE]:
+                raise RuntimeError("OpenRouter returned 502")
+            return {path: "Utilities" for path in paths}
+
+        with self.assertLogs(get_logger(), level="ERROR") as logs:
+            categories = SonarScannerProcessor()._categorize_files_in_chunks(file_paths, categorize)
+
+        self.assertEqual(set(categories), set(file_paths[CATEGORIZATION_CHUNK_SIZE:]))
+        self.assertEqual(calls, [None, None, ["Utilities"]])
+        self.assertIn("chunk 1/3", logs.output[0])
+
+
+class TestCreateSonarPropertiesFile(unittest.TestCase):
+    """Tests for writing sonar-project.properties."""
+
+    def read_properties(self, **kwargs):
+        """Create the properties file in a temporary directory and return its lines."""
+        with TemporaryDirectory() as temp_dir:
+            SonarScannerProcessor()._create_sonar_properties_file(temp_dir, "project", "token", **kwargs)
+            with open(os.path.join(temp_dir, "sonar-project.properties")) as f:
+                return f.read().splitlines()
+
+    def test_analysis_cache_enabled_by_default(self):
+        """Test the analysis cache is switched on in the properties file."""
+        lines = self.read_properties()
+
+        self.assertIn("sonar.projectKey=project", lines)
+        self.assertIn("sonar.analysisCache.enabled=true", lines)
+
+    def test_analysis_cache_disabled(self):
+        """Test --no-cache switches the analysis cache off in the properties file."""
+        lines = self.read_properties(analysis_cache=False)
+
+        self.assertIn("sonar.analysisCache.enabled=false", lines)
+        self.assertNotIn("sonar.analysisCache.enabled=true", lines)
+
+
+class TestReadCeTaskId(unittest.TestCase):
+    """Tests for reading the background task ID that sonar-scanner reports."""
+
+    def test_reads_task_id(self):
+        """Test the ceTaskId is read from .scannerwork/report-task.txt."""
+        with TemporaryDirectory() as temp_dir:
+            os.mkdir(os.path.join(temp_dir, ".scannerwork"))
+            with open(os.path.join(temp_dir, ".scannerwork", "report-task.txt"), "w") as f:
+                f.write("projectKey=project\n"
+                        "serverUrl=https://sonar.example.com\n"
+                        "ceTaskId=AYxyz-123\n"
+                        "ceTaskUrl=https://sonar.example.com/api/ce/task?id=AYxyz-123\n")
+
+            self.assertEqual(SonarScannerProcessor()._read_ce_task_id(temp_dir), "AYxyz-123")
+
+    def test_missing_task_id(self):
+        """Test a report without a ceTaskId returns None."""
+        with TemporaryDirectory() as temp_dir:
+            os.mkdir(os.path.join(temp_dir, ".scannerwork"))
+            with open(os.path.join(temp_dir, ".scannerwork", "report-task.txt"), "w") as f:
+                f.write("projectKey=project\n")
+
+            self.assertIsNone(SonarScannerProcessor()._read_ce_task_id(temp_dir))
+
+    def test_missing_file(self):
+        """Test a missing report-task.txt returns None and logs a warning."""
+        with TemporaryDirectory() as temp_dir:
+            with self.assertLogs(get_logger(), level="WARNING"):
+                self.assertIsNone(SonarScannerProcessor()._read_ce_task_id(temp_dir))
+
+
+class TestCachedFetch(unittest.TestCase):
+    """Tests for the on-disk cache of SonarQube API responses."""
+
+    def setUp(self):
+        """Point the cache at a temporary directory and count the fetches."""
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = os.path.join(temp_dir.name, "cache")
+        cache_patcher = patch("sonar_scanner.API_CACHE_DIR", self.cache_dir)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+        self.processor = SonarScannerProcessor()
+        self.fetch_count = 0
+
+    def fetch(self, project_key):
+        """Fetch a fresh response that tells how many fetches have been made."""
+        self.fetch_count += 1
+        return {"project": project_key, "fetch": self.fetch_count}
+
+    def cached_fetch(self, cache_ttl=60, read_cache=True, fetch=None):
+        """Run _cached_fetch for the measures of a fixed host and project."""
+        return self.processor._cached_fetch("measures", fetch or self.fetch, "https://sonar", "project",
+                                            cache_ttl, read_cache)
+
+    def cache_files(self):
+        """List the cache entries."""
+        return os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []
+
+    def test_disabled_without_ttl(self):
+        """Test nothing is cached when the TTL is 0."""
+        self.assertEqual(self.cached_fetch(cache_ttl=0)["fetch"], 1)
+        self.assertEqual(self.cached_fetch(cache_ttl=0)["fetch"], 2)
+        self.assertEqual(self.cache_files(), [])
+
+    def test_ttl_hit(self):
+        """Test a response younger than the TTL is reused."""
+        self.assertEqual(self.cached_fetch()["fetch"], 1)
+        self.assertEqual(self.cached_fetch(), {"project": "project", "fetch": 1})
+        self.assertEqual(self.fetch_count, 1)
+
+    def test_expired_entry_is_refetched(self):
+        """Test a response older than the TTL is fetched again and replaced."""
+        self.cached_fetch()
+        (cache_file,) = self.cache_files()
+        expired = time.time() - 120
+        os.utime(os.path.join(self.cache_dir, cache_file), (expired, expired))
+
+        self.assertEqual(self.cached_fetch()["fetch"], 2)
+        self.assertEqual(self.cached_fetch()["fetch"], 2)
+
+    def test_refresh_without_reading(self):
+        """Test read_cache=False always fetches but still stores the response."""
+        self.cached_fetch()
+        self.assertEqual(self.cached_fetch(read_cache=False)["fetch"], 2)
+        self.assertEqual(self.cached_fetch()["fetch"], 2)
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_corrupt_entry_is_refetched(self):
+        """Test a cache entry that is not valid JSON is fetched again."""
+        self.cached_fetch()
+        (cache_file,) = self.cache_files()
+        with open(os.path.join(self.cache_dir, cache_file), "w") as f:
+            f.write("{not json")
+
+        self.assertEqual(self.cached_fetch()["fetch"], 2)
+        self.assertEqual(self.cached_fetch()["fetch"], 2)
+
+    def test_failed_fetch_is_not_cached(self):
+        """Test a fetch that raises leaves no cache entry behind."""
+        failing_fetch = MagicMock(side_effect=RuntimeError("HTTP Error 503"))
+        with self.assertRaises(RuntimeError):
+            self.cached_fetch(fetch=failing_fetch)
+
+        self.assertEqual(self.cache_files(), [])
+        self.assertEqual(self.cached_fetch()["fetch"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
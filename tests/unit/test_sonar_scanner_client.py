@@ -0,0 +1,247 @@
+"""Tests for the sonar_scanner.client module.
+
+This module contains tests for the SonarQubeClient, which fetches measures, issues and
+security hotspots from the SonarQube API. The HTTP session is mocked throughout.
+"""
+
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from sonar_scanner.client import CONNECTION_POOL_SIZE, SonarQubeClient
+
+
+def make_response(body):
+    """Build a mocked successful response with a JSON body."""
+    response = MagicMock()
+    response.content = json.dumps(body).encode("utf-8")
+    return response
+
+
+class TestSonarQubeClientConnections(unittest.TestCase):
+    """Tests for how SonarQubeClient uses its connections."""
+
+    def test_requests_in_flight_never_exceed_pool_size(self):
+        """Test concurrent paged fetches never need more connections than the pool holds."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def get(url):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            page = int(url.split("&p=")[1].split("&")[0])
+            key = "hotspots" if "/hotspots/" in url else "issues" if "/issues/" in url else "components"
+            items = [{"key": str(i)} for i in range((page - 1) * 500, min(page * 500, 4500))]
+            return make_response({"paging": {"total": 4500}, key: items})
+
+        with SonarQubeClient("http://sonar", "token") as client, \
+                patch.object(client.session, "get", side_effect=get), \
+                ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(fetch, "project") for fetch in
+                       (client.fetch_file_measures, client.fetch_issues, client.fetch_security_hotspots)]
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(results[0]["components"]), 4500)
+        self.assertEqual(len(results[1]["issues"]), 4500)
+        self.assertEqual(len(results[2]["hotspots"]), 4500)
+        self.assertLessEqual(peak, CONNECTION_POOL_SIZE)
+
+
+class TestGetJson(unittest.TestCase):
+    """Tests for error handling in SonarQubeClient._get_json."""
+
+    def http_error_response(self, status_code, reason):
+        """Build a mocked response whose raise_for_status raises an HTTPError."""
+        response = MagicMock()
+        response.status_code = status_code
+        response.reason = reason
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        return response
+
+    def test_authentication_failure_is_logged_and_raised(self):
+        """Test a 401 logs an authentication error and re-raises."""
+        with SonarQubeClient("http://sonar", "bad-token") as client, \
+                patch.object(client.session, "get", return_value=self.http_error_response(401, "Unauthorized")), \
+                self.assertLogs(client.logger, level="ERROR") as logs:
+            with self.assertRaises(requests.HTTPError):
+                client.fetch_measures("project")
+
+        self.assertIn("Authentication failed", logs.output[0])
+
+    def test_http_error_is_logged_and_raised(self):
+        """Test another HTTP error logs its status and reason and re-raises."""
+        with SonarQubeClient("http://sonar", "token") as client, \
+                patch.object(client.session, "get", return_value=self.http_error_response(404, "Not Found")), \
+                self.assertLogs(client.logger, level="ERROR") as logs:
+            with self.assertRaises(requests.HTTPError):
+                client.fetch_measures("project")
+
+        self.assertIn("HTTP Error 404: Not Found", logs.output[0])
+
+    def test_request_error_is_logged_and_raised(self):
+        """Test a connection error is logged and re-raised."""
+        with SonarQubeClient("http://sonar", "token") as client, \
+                patch.object(client.session, "get", side_effect=requests.ConnectionError("refused")), \
+                self.assertLogs(client.logger, level="ERROR") as logs:
+            with self.assertRaises(requests.ConnectionError):
+                client.fetch_measures("project")
+
+        self.assertIn("Request Error: refused", logs.output[0])
+
+    def test_session_sends_token(self):
+        """Test the token is sent as a bearer token on the shared session."""
+        with SonarQubeClient("http://sonar", "token") as client:
+            self.assertEqual(client.session.headers["Authorization"], "Bearer token")
+
+
+class TestFetchFileMeasures(unittest.TestCase):
+    """Tests for paging through file measures with SonarQubeClient.fetch_file_measures."""
+
+    def fetch(self, reported_total, actual_total, first_page_size=None):
+        """Fetch file measures from a mocked endpoint.
+
+        Args:
+            reported_total: Total number of components the endpoint reports in its paging.
+            actual_total: Number of components the endpoint really serves.
+            first_page_size: Number of components on the first page, if not a full page.
+
+        Returns:
+            Tuple of the fetch result and the page numbers that were requested.
+        """
+        requested_pages = []
+
+        def get(url):
+            page = int(url.split("&p=")[1].split("&")[0])
+            requested_pages.append(page)
+            start, end = (page - 1) * 500, min(page * 500, actual_total)
+            if page == 1 and first_page_size is not None:
+                end = first_page_size
+            components = [{"key": f"project:file{i}.py"} for i in range(start, end)]
+            return make_response({"paging": {"pageIndex": page, "pageSize": 500, "total": reported_total},
+                                  "baseComponent": {"key": "project"}, "components": components})
+
+        with SonarQubeClient("http://sonar", "token") as client, \
+                patch.object(client.session, "get", side_effect=get):
+            result = client.fetch_file_measures("project")
+
+        return result, sorted(requested_pages)
+
+    def assert_components(self, result, count):
+        """Assert the result holds the first count components, in order."""
+        self.assertEqual([c["key"] for c in result["components"]],
+                         [f"project:file{i}.py" for i in range(count)])
+
+    def test_single_page(self):
+        """Test a project that fits on one page is fetched with one request."""
+        result, pages = self.fetch(120, 120)
+
+        self.assert_components(result, 120)
+        self.assertEqual(pages, [1])
+        self.assertEqual(result["paging"], {"pageIndex": 1, "pageSize": 120, "total": 120})
+        self.assertEqual(result["baseComponent"], {"key": "project"})
+
+    def test_multiple_pages_in_order(self):
+        """Test every page is fetched and the components keep their page order."""
+        result, pages = self.fetch(2600, 2600)
+
+        self.assert_components(result, 2600)
+        self.assertEqual(pages, [1, 2, 3, 4, 5, 6])
+
+    def test_total_zero(self):
+        """Test an empty project is fetched with one request."""
+        result, pages = self.fetch(0, 0)
+
+        self.assert_components(result, 0)
+        self.assertEqual(pages, [1])
+        self.assertEqual(result["paging"]["total"], 0)
+
+    def test_total_reported_too_high(self):
+        """Test components stop at the first short page when the total is too high."""
+        result, _ = self.fetch(2600, 1200)
+
+        self.assert_components(result, 1200)
+        self.assertEqual(result["paging"]["total"], 2600)
+
+    def test_total_reported_too_low(self):
+        """Test only the pages covering the reported total are fetched."""
+        result, pages = self.fetch(1000, 1700)
+
+        self.assert_components(result, 1000)
+        self.assertEqual(pages, [1, 2])
+
+    def test_short_first_page(self):
+        """Test a short first page stops paging even when more components are reported."""
+        result, pages = self.fetch(1200, 1200, first_page_size=300)
+
+        self.assert_components(result, 300)
+        self.assertEqual(pages, [1])
+
+
+class TestWaitForTask(unittest.TestCase):
+    """Tests for SonarQubeClient.wait_for_task."""
+
+    def setUp(self):
+        """Create a client and replace its clock with a fake one."""
+        self.client = SonarQubeClient("http://sonar", "token")
+        self.addCleanup(self.client.close)
+        self.now = 0.0
+
+        def sleep(seconds):
+            self.now += seconds
+
+        time_patcher = patch("sonar_scanner.client.time")
+        self.mock_time = time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+        self.mock_time.monotonic.side_effect = lambda: self.now
+        self.mock_time.sleep.side_effect = sleep
+
+    def mock_statuses(self, *statuses):
+        """Make the task endpoint report the given statuses, repeating the last one."""
+        responses = [make_response({"task": {"id": "AY1", "status": status}}) for status in statuses]
+        responses_iter = iter(responses)
+        return patch.object(self.client.session, "get",
+                            side_effect=lambda url: next(responses_iter, responses[-1]))
+
+    def test_returns_final_status(self):
+        """Test polling with growing delays until the task reaches a final status."""
+        with self.mock_statuses("PENDING", "IN_PROGRESS", "IN_PROGRESS", "SUCCESS") as mock_get:
+            status = self.client.wait_for_task("AY1")
+
+        self.assertEqual(status, "SUCCESS")
+        self.assertEqual(mock_get.call_count, 4)
+        mock_get.assert_called_with("http://sonar/api/ce/task?id=AY1")
+        self.assertEqual([c.args[0] for c in self.mock_time.sleep.call_args_list], [1, 2, 4])
+
+    def test_returns_failed_status(self):
+        """Test a failed task is reported as such without further polling."""
+        with self.mock_statuses("FAILED") as mock_get:
+            status = self.client.wait_for_task("AY1")
+
+        self.assertEqual(status, "FAILED")
+        self.assertEqual(mock_get.call_count, 1)
+        self.mock_time.sleep.assert_not_called()
+
+    def test_timeout_returns_none(self):
+        """Test a task that never finishes returns None once the timeout has passed."""
+        with self.mock_statuses("IN_PROGRESS"):
+            status = self.client.wait_for_task("AY1", timeout=100)
+
+        self.assertIsNone(status)
+        # 1 + 2 + 4 + 8 + 15 + 30 = 60, then only the remaining 40 seconds
+        self.assertEqual([c.args[0] for c in self.mock_time.sleep.call_args_list], [1, 2, 4, 8, 15, 30, 30, 10])
+        self.assertEqual(self.now, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()